@@ -0,0 +1,51 @@
+"""Fast JSON parsing for AI responses, using whichever parser is installed."""
+
+import threading
+from typing import Any, Union
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# orjson parses faster than stdlib json; fall back to stdlib when missing
+try:
+    from orjson import loads as _fallback_loads
+except ImportError:
+    from json import loads as _fallback_loads
+
+# simdjson parsers reuse an internal buffer between calls, so keep one per
+# thread rather than sharing one across FastAPI's worker threads
+_local = threading.local()
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document into Python objects.
+
+    Uses simdjson when installed, then orjson, then stdlib json. Every
+    parser raises a ValueError subclass on invalid JSON.
+
+    Args:
+        data: JSON text
+
+    Returns:
+        Parsed dicts/lists/values
+    """
+    if simdjson is None:
+        return _fallback_loads(data)
+
+    parser = getattr(_local, "parser", None)
+    if parser is None:
+        parser = _local.parser = simdjson.Parser()
+
+    if isinstance(data, str):
+        data = data.encode()
+
+    # Convert to plain Python objects before the parser is reused
+    doc = parser.parse(data)
+    if isinstance(doc, simdjson.Object):
+        return doc.as_dict()
+    if isinstance(doc, simdjson.Array):
+        return doc.as_list()
+    return doc
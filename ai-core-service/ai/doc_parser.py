@@ -1,8 +1,13 @@
 """Parse project planning documents for ClickUp publishing."""
 
-import json
+from collections import defaultdict
 from typing import Any, Dict, List, Optional
 
+from ._json import json_loads
+
+# ClickUp priority levels by breakdown priority name
+_PRIORITY_MAP = {"urgent": 1, "high": 2, "normal": 3, "low": 4}
+
 
 class ProjectDocParser:
     """
@@ -34,23 +39,22 @@ class ProjectDocParser:
             19
         """
         try:
-            breakdown = json.loads(ai_analysis)
-        except json.JSONDecodeError as e:
+            breakdown = json_loads(ai_analysis)
+        except ValueError as e:
             raise ValueError(f"Invalid JSON in ai_analysis: {e}")
 
         # Validate structure
         if "phases" not in breakdown:
             raise ValueError("Missing 'phases' in breakdown structure")
 
-        # Calculate totals
-        total_tasks = sum(
-            len(phase.get("subtasks", [])) for phase in breakdown["phases"]
-        )
-        total_hours = sum(
-            task.get("estimated_hours", 0)
-            for phase in breakdown["phases"]
-            for task in phase.get("subtasks", [])
-        )
+        # Calculate totals in one pass over the phases
+        total_tasks = 0
+        total_hours = 0
+        for phase in breakdown["phases"]:
+            subtasks = phase.get("subtasks") or ()
+            total_tasks += len(subtasks)
+            for task in subtasks:
+                total_hours += task.get("estimated_hours", 0)
 
         return {
             "title": breakdown.get("title", "Untitled Project"),
@@ -95,16 +99,20 @@ class ProjectDocParser:
 
             for subtask in phase.get("subtasks", []):
                 # Map priority if exists, default to normal
-                priority_map = {"urgent": 1, "high": 2, "normal": 3, "low": 4}
-                priority = priority_map.get(
+                priority = _PRIORITY_MAP.get(
                     subtask.get("priority", "normal").lower(), 3
                 )
 
+                hours = subtask.get("estimated_hours", 0)
+                skills = subtask.get("required_skills") or []
+
                 task = {
                     "name": subtask["name"],
-                    "description": self._format_task_description(subtask, phase_name),
-                    "estimated_hours": subtask.get("estimated_hours", 0),
-                    "required_skills": subtask.get("required_skills", []),
+                    "description": self._format_task_description(
+                        subtask.get("description", ""), hours, skills, phase_name
+                    ),
+                    "estimated_hours": hours,
+                    "required_skills": skills,
                     "priority": priority,
                     "phase_name": phase_name,
                     "tags": ["AI-Generated", phase_name],
@@ -114,12 +122,20 @@ class ProjectDocParser:
 
         return clickup_tasks
 
-    def _format_task_description(self, subtask: Dict[str, Any], phase_name: str) -> str:
+    def _format_task_description(
+        self,
+        description: str,
+        estimated_hours: float,
+        required_skills: List[str],
+        phase_name: str,
+    ) -> str:
         """
         Format a rich task description for ClickUp.
 
         Args:
-            subtask: Task dict from breakdown
+            description: Task description from breakdown
+            estimated_hours: Time estimate
+            required_skills: Skills needed for the task
             phase_name: Name of the phase
 
         Returns:
@@ -128,19 +144,17 @@ class ProjectDocParser:
         parts = []
 
         # Main description
-        parts.append(subtask.get("description", ""))
+        parts.append(description)
         parts.append("")
 
         # Metadata
         parts.append("---")
         parts.append("")
         parts.append(f"**Phase:** {phase_name}")
-        parts.append(f"**Estimated Hours:** {subtask.get('estimated_hours', 0)}")
+        parts.append(f"**Estimated Hours:** {estimated_hours}")
 
-        if subtask.get("required_skills"):
-            parts.append(
-                f"**Required Skills:** {', '.join(subtask['required_skills'])}"
-            )
+        if required_skills:
+            parts.append(f"**Required Skills:** {', '.join(required_skills)}")
 
         parts.append("")
         parts.append("*Generated by Alfred AI Project Planning*")
@@ -164,12 +178,9 @@ class ProjectDocParser:
             >>> for phase, phase_tasks in grouped.items():
             ...     print(f"{phase}: {len(phase_tasks)} tasks")
         """
-        grouped = {}
+        grouped = defaultdict(list)
 
         for task in tasks:
-            phase_name = task["phase_name"]
-            if phase_name not in grouped:
-                grouped[phase_name] = []
-            grouped[phase_name].append(task)
+            grouped[task["phase_name"]].append(task)
 
-        return grouped
+        return dict(grouped)
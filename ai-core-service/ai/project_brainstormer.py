@@ -1,12 +1,14 @@
 """AI-powered project brainstorming and planning service."""
 
-import json
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 from anthropic import Anthropic
 from dotenv import load_dotenv
 
+from ._json import json_loads
 from .prompts import (
     get_milestone_generation_prompt,
     get_project_analysis_prompt,
@@ -17,6 +19,13 @@ from .prompts import (
 
 load_dotenv()
 
+# A ```json or plain ``` code block, up to its closing fence (or the end of
+# a truncated response)
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL)
+
+# A closed ```json code block; its body is checked before the stream is cut
+_CLOSED_JSON_FENCE_RE = re.compile(r"```json\s*(.*?)```", re.DOTALL)
+
 
 class ProjectBrainstormer:
     """
@@ -29,6 +38,9 @@ class ProjectBrainstormer:
     4. Refines and validates the complete plan
     """
 
+    # Most milestone task requests sent to Claude at once
+    MAX_CONCURRENT_REQUESTS = 6
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize the brainstormer with Anthropic API.
@@ -81,15 +93,8 @@ class ProjectBrainstormer:
         """
         prompt = get_simple_project_breakdown_prompt(project_idea)
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=4096,
-            temperature=0.7,
-            messages=[{"role": "user", "content": prompt}],
-        )
-
         # Extract and return structured JSON
-        content = response.content[0].text
+        content = self._generate(prompt)
         breakdown = self._extract_json(content)
 
         return breakdown
@@ -124,15 +129,8 @@ class ProjectBrainstormer:
         """
         prompt = get_project_analysis_prompt(project_idea)
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=4096,
-            temperature=0.7,
-            messages=[{"role": "user", "content": prompt}],
-        )
-
         # Extract JSON from response
-        content = response.content[0].text
+        content = self._generate(prompt)
         analysis = self._extract_json(content)
 
         return analysis
@@ -162,14 +160,7 @@ class ProjectBrainstormer:
         """
         prompt = get_milestone_generation_prompt(project_analysis)
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=4096,
-            temperature=0.7,
-            messages=[{"role": "user", "content": prompt}],
-        )
-
-        content = response.content[0].text
+        content = self._generate(prompt)
         result = self._extract_json(content)
 
         return result.get("milestones", [])
@@ -203,14 +194,7 @@ class ProjectBrainstormer:
         """
         prompt = get_task_generation_prompt(milestone, project_context)
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=4096,
-            temperature=0.7,
-            messages=[{"role": "user", "content": prompt}],
-        )
-
-        content = response.content[0].text
+        content = self._generate(prompt)
         result = self._extract_json(content)
 
         return result.get("tasks", [])
@@ -253,13 +237,24 @@ class ProjectBrainstormer:
         print(f"✅ Created {len(milestones)} milestones")
 
         print("\n📋 Generating tasks for each milestone...")
-        all_tasks = []
-        for i, milestone in enumerate(milestones, 1):
-            print(f"  {i}. {milestone['name']}...")
-            tasks = self.generate_tasks_for_milestone(milestone, analysis)
-            milestone["tasks"] = tasks
-            all_tasks.extend(tasks)
-            print(f"     ✅ {len(tasks)} tasks")
+        # The milestones are independent, so request their tasks concurrently;
+        # the Anthropic client is safe to share across threads
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(len(milestones), self.MAX_CONCURRENT_REQUESTS))
+        ) as executor:
+            results = executor.map(
+                lambda milestone: self.generate_tasks_for_milestone(
+                    milestone, analysis
+                ),
+                milestones,
+            )
+
+            all_tasks = []
+            for i, (milestone, tasks) in enumerate(zip(milestones, results), 1):
+                print(f"  {i}. {milestone['name']}...")
+                milestone["tasks"] = tasks
+                all_tasks.extend(tasks)
+                print(f"     ✅ {len(tasks)} tasks")
 
         print(f"\n✅ Total tasks generated: {len(all_tasks)}")
 
@@ -317,18 +312,46 @@ class ProjectBrainstormer:
         """
         prompt = get_project_refinement_prompt(analysis, milestones, all_tasks)
 
-        response = self.client.messages.create(
-            model=self.model,
-            max_tokens=4096,
-            temperature=0.5,  # Lower temperature for more consistent review
-            messages=[{"role": "user", "content": prompt}],
-        )
-
-        content = response.content[0].text
+        # Lower temperature for more consistent review
+        content = self._generate(prompt, temperature=0.5)
         refinement = self._extract_json(content)
 
         return refinement
 
+    def _generate(self, prompt: str, temperature: float = 0.7) -> str:
+        """
+        Send a prompt to Claude and return the response text.
+
+        The response is streamed, and the stream is closed as soon as a
+        fenced ```json block has ended and its body parses, so any commentary
+        Claude adds after it isn't waited for. Otherwise (e.g. only other
+        code blocks so far) the stream is read to the end.
+        """
+        chunks = []
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=4096,
+            temperature=temperature,
+            messages=[{"role": "user", "content": prompt}],
+        ) as stream:
+            for text in stream.text_stream:
+                chunks.append(text)
+                if "`" in text and self._json_block_complete("".join(chunks)):
+                    break
+
+        return "".join(chunks)
+
+    @staticmethod
+    def _json_block_complete(text: str) -> bool:
+        """Whether ``text`` contains a closed ```json block with valid JSON."""
+        for match in _CLOSED_JSON_FENCE_RE.finditer(text):
+            try:
+                json_loads(match.group(1).strip())
+                return True
+            except ValueError:
+                continue
+        return False
+
     def _extract_json(self, text: str) -> Dict[str, Any]:
         """
         Extract JSON from Claude's response.
@@ -336,20 +359,12 @@ class ProjectBrainstormer:
         Claude sometimes wraps JSON in markdown code blocks, so we handle that.
         """
         # Try to find JSON in markdown code block
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            json_str = text[start:end].strip()
-        elif "```" in text:
-            start = text.find("```") + 3
-            end = text.find("```", start)
-            json_str = text[start:end].strip()
-        else:
-            json_str = text.strip()
+        match = _JSON_FENCE_RE.search(text)
+        json_str = match.group(1).strip() if match else text.strip()
 
         try:
-            return json.loads(json_str)
-        except json.JSONDecodeError as e:
+            return json_loads(json_str)
+        except ValueError as e:
             raise ValueError(
                 f"Failed to parse JSON from Claude response: {e}\n\nResponse: {text}"
             )
@@ -27,6 +27,21 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class TeamCommandTree(app_commands.CommandTree):
+    """Command tree that doesn't log expected check failures as errors."""
+
+    async def on_error(
+        self, interaction: discord.Interaction, error: app_commands.AppCommandError
+    ):
+        # Rejected checks (e.g. non-admins) are answered by the command's own
+        # error handler; only log them instead of dumping a traceback
+        if isinstance(error, app_commands.CheckFailure):
+            command = interaction.command.name if interaction.command else "unknown"
+            logger.info(f"Check failed for /{command} by {interaction.user}: {error}")
+            return
+        await super().on_error(interaction, error)
+
+
 class TeamBot(commands.Bot):
     """Main bot class for team management."""
 
@@ -35,7 +50,12 @@ class TeamBot(commands.Bot):
         intents.message_content = True
         intents.members = True
 
-        super().__init__(command_prefix="!", intents=intents, help_command=None)
+        super().__init__(
+            command_prefix="!",
+            intents=intents,
+            help_command=None,
+            tree_cls=TeamCommandTree,
+        )
 
         self.team_service = TeamMemberService()
         self.docs_service = DocsService()
@@ -81,6 +101,7 @@ class TeamBot(commands.Bot):
 
         # Register team management commands
         self.team_management.register_commands(self.tree)
+        self.team_management.start_team_refresh()
 
         # Register debug command
         self.tree.add_command(self._debug_perms_command())
@@ -96,6 +117,12 @@ class TeamBot(commands.Bot):
             await self.tree.sync(guild=guild)
             logger.info(f"Synced commands to guild {self.guild_id}")
 
+    async def close(self):
+        """Release shared HTTP connections when the bot shuts down."""
+        self.team_management.stop_team_refresh()
+        await ClickUpService.close()
+        await super().close()
+
     def _debug_perms_command(self) -> app_commands.Command:
         """Create debug permissions command."""
 
@@ -184,6 +211,21 @@ class TeamBot(commands.Bot):
         logger.info(f"{self.user} has connected to Discord!")
         logger.info(f"Bot is in {len(self.guilds)} guilds")
 
+        for guild in self.guilds:
+            self.team_management.refresh_admin_role_ids(guild)
+
+    async def on_guild_role_create(self, role: discord.Role):
+        """Keep cached admin role IDs in sync with the guild."""
+        self.team_management.refresh_admin_role_ids(role.guild)
+
+    async def on_guild_role_delete(self, role: discord.Role):
+        """Keep cached admin role IDs in sync with the guild."""
+        self.team_management.refresh_admin_role_ids(role.guild)
+
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        """Keep cached admin role IDs in sync with the guild."""
+        self.team_management.refresh_admin_role_ids(after.guild)
+
     async def on_member_join(self, member: discord.Member):
         """Welcome new members in #alfred channel."""
         logger.info(f"New member joined: {member} ({member.id})")
@@ -490,6 +490,7 @@ class RoleInputModal(discord.ui.Modal, title="Assign Role"):
                                 self.team_service.data_service.add_member_to_team(
                                     new_member.id, db_team.id, role=role
                                 )
+                                self.team_service.invalidate_memberships(db_team.id)
                                 logger.info(
                                     f"Added {pending.name} to team {team} in database"
                                 )
@@ -2,9 +2,15 @@
 
 import os
 import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import discord
 import httpx
 
 # Add shared-services to path
@@ -18,6 +24,12 @@ sys.path.insert(0, str(docs_service_path))
 from data_service import DataService, create_data_service
 from data_service.models import TeamMember, TeamMemberUpdate
 
+# orjson parses large ClickUp task payloads faster; fall back to stdlib json
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Import Google Docs service
 try:
     from docs_service.google_docs_client import GoogleDocsService
@@ -29,8 +41,13 @@ except ImportError as e:
 class TeamMemberService:
     """Service for managing team member data."""
 
+    # Seconds active membership rows are reused per team
+    MEMBERSHIP_CACHE_TTL = 30
+
     def __init__(self):
         self.data_service: DataService = create_data_service()
+        # team_id -> (fetched_at, membership rows with embedded ClickUp token)
+        self._memberships_cache: dict[str, tuple[float, list[dict]]] = {}
 
     def get_member_by_discord(self, discord_username: str) -> Optional[TeamMember]:
         """Get team member by Discord username."""
@@ -51,13 +68,47 @@ class TeamMemberService:
         update = TeamMemberUpdate(clickup_api_token=clickup_token)
         return self.data_service.update_team_member(member.id, update)
 
+    def get_active_memberships(self, team_id: str) -> list[dict]:
+        """
+        Get a team's active membership rows with each member's ClickUp token.
+
+        Cached for MEMBERSHIP_CACHE_TTL seconds so back-to-back reports don't
+        re-read the same rows.
+
+        Args:
+            team_id: Team UUID
+
+        Returns:
+            List of {"member_id", "team_members": {"clickup_api_token"}} rows
+        """
+        team_id = str(team_id)
+        cached = self._memberships_cache.get(team_id)
+        if cached and time.monotonic() - cached[0] < self.MEMBERSHIP_CACHE_TTL:
+            return cached[1]
+
+        rows = (
+            self.data_service.client.table("team_memberships")
+            .select("member_id, team_members(clickup_api_token)")
+            .eq("team_id", team_id)
+            .eq("is_active", True)
+            .execute()
+            .data
+        )
+        self._memberships_cache[team_id] = (time.monotonic(), rows)
+        return rows
+
+    def invalidate_memberships(self, team_id: str) -> None:
+        """Drop cached membership rows after a team's members change."""
+        self._memberships_cache.pop(str(team_id), None)
+
 
 class DocsService:
     """Service for creating team member documentation."""
 
     def __init__(self):
         """Initialize Google Docs service if credentials are available."""
-        self.docs_service = None
+        self._client_kwargs: Optional[dict] = None
+        self._local = threading.local()
         self._team_management_folder_id = None
         self._main_roster_sheet_id = None  # Cache for auto-created main roster
 
@@ -68,17 +119,35 @@ class DocsService:
                 delegated_email = os.getenv("GOOGLE_DELEGATED_USER_EMAIL")
 
                 if credentials_path and os.path.exists(credentials_path):
-                    self.docs_service = GoogleDocsService(
-                        credentials_path=credentials_path,
-                        default_folder_id=folder_id,
-                        delegated_user_email=delegated_email,
-                    )
+                    client_kwargs = {
+                        "credentials_path": credentials_path,
+                        "default_folder_id": folder_id,
+                        "delegated_user_email": delegated_email,
+                    }
+                    self._local.client = GoogleDocsService(**client_kwargs)
+                    self._client_kwargs = client_kwargs
             except Exception as e:
                 print(f"Warning: Could not initialize Google Docs service: {e}")
 
+    @property
+    def docs_service(self):
+        """
+        The GoogleDocsService for the calling thread.
+
+        The Google API client isn't thread-safe and the bot calls it from
+        asyncio.to_thread workers, so each thread gets its own client built
+        from the same credentials.
+        """
+        if self._client_kwargs is None:
+            return None
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = GoogleDocsService(**self._client_kwargs)
+        return client
+
     def is_available(self) -> bool:
         """Check if Google Docs service is available."""
-        return self.docs_service is not None
+        return self._client_kwargs is not None
 
     def get_team_management_folder(self) -> Optional[str]:
         """
@@ -149,6 +218,58 @@ class DocsService:
             print(f"Error creating team folder structure: {e}")
             return None
 
+    def delete_team_folder(self, folder_id: str) -> bool:
+        """
+        Delete a team's Drive folder and everything in it.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.is_available():
+            return False
+
+        try:
+            return self.docs_service.delete_document(folder_id)
+        except Exception as e:
+            print(f"Error deleting team folder: {e}")
+            return False
+
+    def create_team_folder_structures(
+        self, team_names: list[str], max_workers: int = 5
+    ) -> dict[str, Optional[dict]]:
+        """
+        Create folder structures for several teams concurrently.
+
+        Each worker thread uses its own GoogleDocsService (see docs_service).
+
+        Args:
+            team_names: Teams to create folder structures for
+            max_workers: Maximum teams processed at once
+
+        Returns:
+            Dict of team name -> result of create_team_folder_structure (None if failed)
+        """
+        if not self.is_available() or not team_names:
+            return {team_name: None for team_name in team_names}
+
+        def create(team_name: str) -> dict:
+            return self.docs_service.create_team_folder_structure(team_name)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(create, team_name): team_name
+                for team_name in team_names
+            }
+            for future in as_completed(futures):
+                team_name = futures[future]
+                try:
+                    results[team_name] = future.result()
+                except Exception as e:
+                    print(f"Error creating team folder structure for {team_name}: {e}")
+                    results[team_name] = None
+        return results
+
     def get_or_create_main_roster(self) -> Optional[str]:
         """
         Get or create the main organization roster spreadsheet.
@@ -269,14 +390,52 @@ class DocsService:
             return False
 
 
+@lru_cache(maxsize=1)
+def get_team_member_service() -> TeamMemberService:
+    """Get the process-wide TeamMemberService, creating it on first use."""
+    return TeamMemberService()
+
+
+@lru_cache(maxsize=1)
+def get_docs_service() -> DocsService:
+    """Get the process-wide DocsService, creating it on first use."""
+    return DocsService()
+
+
 class ClickUpService:
     """Service for interacting with ClickUp API."""
 
+    # Shared connection pool - a ClickUpService is created per command, so
+    # keep TLS connections alive across instances instead of per request.
+    _http_client: Optional[httpx.AsyncClient] = None
+
+    # Last task page per (token, list, params, fields) with its ETag, so an
+    # unchanged list can be answered by a 304 instead of a full payload.
+    # Least recently used entries are dropped past LIST_TASK_CACHE_SIZE.
+    LIST_TASK_CACHE_SIZE = 128
+    _list_task_cache: OrderedDict[tuple, tuple[str, list[dict]]] = OrderedDict()
+
     def __init__(self, api_token: str):
         self.api_token = api_token
         self.base_url = "https://api.clickup.com/api/v2"
         self.headers = {"Authorization": api_token, "Content-Type": "application/json"}
 
+    @classmethod
+    def _get_http_client(cls) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if cls._http_client is None or cls._http_client.is_closed:
+            cls._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=50, keepalive_expiry=60.0)
+            )
+        return cls._http_client
+
+    @classmethod
+    async def close(cls):
+        """Close the shared HTTP client."""
+        if cls._http_client is not None:
+            await cls._http_client.aclose()
+            cls._http_client = None
+
     async def validate_token(self) -> tuple[bool, Optional[str]]:
         """
         Validate ClickUp API token by making a test request.
@@ -284,56 +443,59 @@ class ClickUpService:
         Returns:
             tuple: (is_valid, error_message)
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/user", headers=self.headers, timeout=10.0
-                )
+        client = self._get_http_client()
+        try:
+            response = await client.get(
+                f"{self.base_url}/user", headers=self.headers, timeout=10.0
+            )
 
-                if response.status_code == 200:
-                    return True, None
-                elif response.status_code == 401:
-                    return (
-                        False,
-                        "Invalid API token. Please check your token and try again.",
-                    )
-                else:
-                    return False, f"Unexpected error: {response.status_code}"
-            except httpx.TimeoutException:
-                return False, "Request timed out. Please try again."
-            except Exception as e:
-                return False, f"Error validating token: {str(e)}"
+            if response.status_code == 200:
+                return True, None
+            elif response.status_code == 401:
+                return (
+                    False,
+                    "Invalid API token. Please check your token and try again.",
+                )
+            else:
+                return False, f"Unexpected error: {response.status_code}"
+        except httpx.TimeoutException:
+            return False, "Request timed out. Please try again."
+        except Exception as e:
+            return False, f"Error validating token: {str(e)}"
 
     async def get_user_info(self) -> Optional[dict]:
         """Get authenticated user info from ClickUp."""
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/user", headers=self.headers, timeout=10.0
-                )
+        client = self._get_http_client()
+        try:
+            response = await client.get(
+                f"{self.base_url}/user", headers=self.headers, timeout=10.0
+            )
 
-                if response.status_code == 200:
-                    return response.json().get("user")
-                return None
-            except Exception:
-                return None
+            if response.status_code == 200:
+                return response.json().get("user")
+            return None
+        except Exception:
+            return None
 
     async def get_all_teams(self) -> list[dict]:
         """Get all teams the authenticated user has access to."""
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/team", headers=self.headers, timeout=10.0
-                )
+        client = self._get_http_client()
+        try:
+            response = await client.get(
+                f"{self.base_url}/team", headers=self.headers, timeout=10.0
+            )
 
-                if response.status_code == 200:
-                    return response.json().get("teams", [])
-                return []
-            except Exception:
-                return []
+            if response.status_code == 200:
+                return response.json().get("teams", [])
+            return []
+        except Exception:
+            return []
 
     async def get_all_tasks(
-        self, assigned_only: bool = True, list_ids: Optional[list[str]] = None
+        self,
+        assigned_only: bool = True,
+        list_ids: Optional[list[str]] = None,
+        fields: Optional[list[str]] = None,
     ) -> list[dict]:
         """
         Get all tasks assigned to the authenticated user across all teams/spaces.
@@ -341,80 +503,117 @@ class ClickUpService:
         Args:
             assigned_only: If True, only return tasks assigned to the authenticated user
             list_ids: Optional list of ClickUp list IDs to filter by (for scoping to project lists)
+            fields: Optional task keys to keep. ClickUp has no partial-response
+                option, so other keys (custom fields, description, checklists...)
+                are dropped as each page is parsed.
 
         Returns:
             List of task dictionaries
         """
         all_tasks = []
 
-        async with httpx.AsyncClient() as client:
-            try:
-                # Get user info first
-                user_info = await self.get_user_info()
-                if not user_info:
-                    return []
-
-                user_id = user_info.get("id")
-
-                # If list_ids are provided, fetch from specific lists
-                if list_ids:
-                    for list_id in list_ids:
-                        params = {
-                            "subtasks": "true",
-                            "include_closed": "false",
-                        }
-
-                        if assigned_only and user_id:
-                            params["assignees[]"] = user_id
-
-                        try:
-                            response = await client.get(
-                                f"{self.base_url}/list/{list_id}/task",
-                                headers=self.headers,
-                                params=params,
-                                timeout=15.0,
-                            )
+        def keep(tasks: list[dict]) -> list[dict]:
+            if not fields:
+                return tasks
+            return [{key: task[key] for key in fields if key in task} for task in tasks]
 
-                            if response.status_code == 200:
-                                tasks = response.json().get("tasks", [])
-                                all_tasks.extend(tasks)
-                        except Exception:
-                            continue
-                else:
-                    # Get all teams (original behavior)
-                    teams = await self.get_all_teams()
-
-                    for team in teams:
-                        team_id = team.get("id")
-                        if not team_id:
-                            continue
-
-                        # Get tasks for this team using the team endpoint
-                        params = {
-                            "subtasks": "true",
-                            "include_closed": "false",
-                        }
-
-                        if assigned_only and user_id:
-                            params["assignees[]"] = user_id
-
-                        try:
-                            response = await client.get(
-                                f"{self.base_url}/team/{team_id}/task",
-                                headers=self.headers,
-                                params=params,
-                                timeout=15.0,
-                            )
+        client = self._get_http_client()
+        try:
+            # Get user info first
+            user_info = await self.get_user_info()
+            if not user_info:
+                return []
 
-                            if response.status_code == 200:
-                                tasks = response.json().get("tasks", [])
-                                all_tasks.extend(tasks)
-                        except Exception:
-                            continue
+            user_id = user_info.get("id")
 
-                return all_tasks
-            except Exception:
-                return []
+            # If list_ids are provided, fetch from specific lists
+            if list_ids:
+                for list_id in list_ids:
+                    params = {
+                        "subtasks": "true",
+                        "include_closed": "false",
+                    }
+
+                    if assigned_only and user_id:
+                        params["assignees[]"] = user_id
+
+                    cache_key = (
+                        self.api_token,
+                        list_id,
+                        tuple(sorted(params.items())),
+                        tuple(fields or ()),
+                    )
+                    cached = self._list_task_cache.get(cache_key)
+                    headers = self.headers
+                    if cached:
+                        self._list_task_cache.move_to_end(cache_key)
+                        headers = {**self.headers, "If-None-Match": cached[0]}
+
+                    try:
+                        response = await client.get(
+                            f"{self.base_url}/list/{list_id}/task",
+                            headers=headers,
+                            params=params,
+                            timeout=15.0,
+                        )
+
+                        if response.status_code == 304 and cached:
+                            # Callers annotate tasks, so hand out copies
+                            all_tasks.extend(dict(task) for task in cached[1])
+                        elif response.status_code == 200:
+                            tasks = keep(
+                                json_loads(response.content).get("tasks", [])
+                            )
+                            all_tasks.extend(tasks)
+                            etag = response.headers.get("ETag")
+                            if etag:
+                                self._list_task_cache[cache_key] = (
+                                    etag,
+                                    [dict(task) for task in tasks],
+                                )
+                                self._list_task_cache.move_to_end(cache_key)
+                                if (
+                                    len(self._list_task_cache)
+                                    > self.LIST_TASK_CACHE_SIZE
+                                ):
+                                    self._list_task_cache.popitem(last=False)
+                    except Exception:
+                        continue
+            else:
+                # Get all teams (original behavior)
+                teams = await self.get_all_teams()
+
+                for team in teams:
+                    team_id = team.get("id")
+                    if not team_id:
+                        continue
+
+                    # Get tasks for this team using the team endpoint
+                    params = {
+                        "subtasks": "true",
+                        "include_closed": "false",
+                    }
+
+                    if assigned_only and user_id:
+                        params["assignees[]"] = user_id
+
+                    try:
+                        response = await client.get(
+                            f"{self.base_url}/team/{team_id}/task",
+                            headers=self.headers,
+                            params=params,
+                            timeout=15.0,
+                        )
+
+                        if response.status_code == 200:
+                            tasks = json_loads(response.content).get("tasks", [])
+                            all_tasks.extend(keep(tasks))
+                    except Exception:
+                        continue
+
+            return all_tasks
+        except Exception:
+            return []
 
     async def get_tasks(self, list_id: str, assigned_only: bool = True) -> list[dict]:
         """
@@ -427,26 +626,26 @@ class ClickUpService:
         Returns:
             List of task dictionaries
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                params = {}
-                if assigned_only:
-                    user_info = await self.get_user_info()
-                    if user_info:
-                        params["assignees[]"] = user_info.get("id")
-
-                response = await client.get(
-                    f"{self.base_url}/list/{list_id}/task",
-                    headers=self.headers,
-                    params=params,
-                    timeout=10.0,
-                )
+        client = self._get_http_client()
+        try:
+            params = {}
+            if assigned_only:
+                user_info = await self.get_user_info()
+                if user_info:
+                    params["assignees[]"] = user_info.get("id")
+
+            response = await client.get(
+                f"{self.base_url}/list/{list_id}/task",
+                headers=self.headers,
+                params=params,
+                timeout=10.0,
+            )
 
-                if response.status_code == 200:
-                    return response.json().get("tasks", [])
-                return []
-            except Exception:
-                return []
+            if response.status_code == 200:
+                return response.json().get("tasks", [])
+            return []
+        except Exception:
+            return []
 
     async def get_space_tasks(
         self, space_id: str, assigned_only: bool = False
@@ -461,30 +660,30 @@ class ClickUpService:
         Returns:
             List of task dictionaries
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                params = {
-                    "subtasks": "true",
-                    "include_closed": "false",
-                }
-
-                if assigned_only:
-                    user_info = await self.get_user_info()
-                    if user_info:
-                        params["assignees[]"] = user_info.get("id")
+        client = self._get_http_client()
+        try:
+            params = {
+                "subtasks": "true",
+                "include_closed": "false",
+            }
 
-                response = await client.get(
-                    f"{self.base_url}/space/{space_id}/task",
-                    headers=self.headers,
-                    params=params,
-                    timeout=15.0,
-                )
+            if assigned_only:
+                user_info = await self.get_user_info()
+                if user_info:
+                    params["assignees[]"] = user_info.get("id")
+
+            response = await client.get(
+                f"{self.base_url}/space/{space_id}/task",
+                headers=self.headers,
+                params=params,
+                timeout=15.0,
+            )
 
-                if response.status_code == 200:
-                    return response.json().get("tasks", [])
-                return []
-            except Exception:
-                return []
+            if response.status_code == 200:
+                return response.json().get("tasks", [])
+            return []
+        except Exception:
+            return []
 
     async def get_task_details(self, task_id: str) -> Optional[dict]:
         """
@@ -496,20 +695,20 @@ class ClickUpService:
         Returns:
             Task details dictionary with full information, or None if failed
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/task/{task_id}",
-                    headers=self.headers,
-                    timeout=10.0,
-                )
+        client = self._get_http_client()
+        try:
+            response = await client.get(
+                f"{self.base_url}/task/{task_id}",
+                headers=self.headers,
+                timeout=10.0,
+            )
 
-                if response.status_code == 200:
-                    return response.json()
-                return None
-            except Exception as e:
-                print(f"Error fetching task details: {e}")
-                return None
+            if response.status_code == 200:
+                return response.json()
+            return None
+        except Exception as e:
+            print(f"Error fetching task details: {e}")
+            return None
 
     async def get_task_comments(self, task_id: str) -> list[dict]:
         """
@@ -521,20 +720,20 @@ class ClickUpService:
         Returns:
             List of comment dictionaries
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.base_url}/task/{task_id}/comment",
-                    headers=self.headers,
-                    timeout=10.0,
-                )
+        client = self._get_http_client()
+        try:
+            response = await client.get(
+                f"{self.base_url}/task/{task_id}/comment",
+                headers=self.headers,
+                timeout=10.0,
+            )
 
-                if response.status_code == 200:
-                    return response.json().get("comments", [])
-                return []
-            except Exception as e:
-                print(f"Error fetching task comments: {e}")
-                return []
+            if response.status_code == 200:
+                return response.json().get("comments", [])
+            return []
+        except Exception as e:
+            print(f"Error fetching task comments: {e}")
+            return []
 
     async def post_task_comment(
         self, task_id: str, comment_text: str
@@ -549,42 +748,47 @@ class ClickUpService:
         Returns:
             Comment dictionary if successful, None otherwise
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                payload = {"comment_text": comment_text}
+        client = self._get_http_client()
+        try:
+            payload = {"comment_text": comment_text}
 
-                response = await client.post(
-                    f"{self.base_url}/task/{task_id}/comment",
-                    headers=self.headers,
-                    json=payload,
-                    timeout=10.0,
-                )
+            response = await client.post(
+                f"{self.base_url}/task/{task_id}/comment",
+                headers=self.headers,
+                json=payload,
+                timeout=10.0,
+            )
 
-                if response.status_code == 200:
-                    return response.json()
-                return None
-            except Exception as e:
-                print(f"Error posting comment: {e}")
-                return None
+            if response.status_code == 200:
+                return response.json()
+            return None
+        except Exception as e:
+            print(f"Error posting comment: {e}")
+            return None
 
 
 class DiscordTeamService:
     """Service for creating Discord roles and channels for teams."""
 
-    # Color mapping for Discord roles
+    # Color mapping for Discord roles, built once
     COLORS = {
-        "blue": 0x3498DB,
-        "green": 0x2ECC71,
-        "red": 0xE74C3C,
-        "purple": 0x9B59B6,
-        "orange": 0xE67E22,
-        "yellow": 0xF1C40F,
-        "teal": 0x1ABC9C,
-        "pink": 0xE91E63,
+        "blue": discord.Color(0x3498DB),
+        "green": discord.Color(0x2ECC71),
+        "red": discord.Color(0xE74C3C),
+        "purple": discord.Color(0x9B59B6),
+        "orange": discord.Color(0xE67E22),
+        "yellow": discord.Color(0xF1C40F),
+        "teal": discord.Color(0x1ABC9C),
+        "pink": discord.Color(0xE91E63),
     }
 
+    @classmethod
+    def get_color(cls, color: str) -> discord.Color:
+        """Resolve a color name to a Discord color (default: blue)."""
+        return cls.COLORS.get(color.lower(), cls.COLORS["blue"])
+
     async def create_team_roles(
-        self, guild, team_name: str, color: str = "blue"
+        self, guild, team_name: str, color: Optional[discord.Color] = None
     ) -> tuple:
         """
         Create Discord roles for a team (member role + manager role).
@@ -592,28 +796,24 @@ class DiscordTeamService:
         Args:
             guild: Discord guild object
             team_name: Name of the team
-            color: Color name for the role (default: blue)
+            color: Color for the role (default: blue, see get_color)
 
         Returns:
             Tuple of (team_role, manager_role) if successful, (None, None) otherwise
         """
         try:
-            import discord
-
-            color_value = self.COLORS.get(color.lower(), self.COLORS["blue"])
+            color = color or self.COLORS["blue"]
 
             # Create team member role
             team_role = await guild.create_role(
                 name=team_name,
-                color=discord.Color(color_value),
+                color=color,
                 mentionable=True,
                 reason=f"Team role created for {team_name}",
             )
 
             # Create manager role (slightly different color, permissions set via channel overwrites)
-            manager_color = (
-                discord.Color(color_value).value - 0x111111
-            )  # Slightly darker
+            manager_color = color.value - 0x111111  # Slightly darker
             manager_role = await guild.create_role(
                 name=f"{team_name} Manager",
                 color=discord.Color(manager_color),
@@ -640,8 +840,6 @@ class DiscordTeamService:
             Tuple of (general_channel, standup_channel)
         """
         try:
-            import discord
-
             # Create category if it doesn't exist
             category_name = f"{team_name} Team"
             category = discord.utils.get(guild.categories, name=category_name)
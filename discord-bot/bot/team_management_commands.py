@@ -1,14 +1,34 @@
 """Discord team management commands for creating and managing teams."""
 
+import asyncio
+import datetime
 import logging
+import time
+from collections import Counter
 from typing import Optional
 from uuid import UUID
 
 import discord
 from discord import app_commands
 
+from bot.services import ClickUpService
+
 logger = logging.getLogger(__name__)
 
+# ClickUp task keys read by /team-report
+REPORT_TASK_FIELDS = [
+    "id",
+    "name",
+    "status",
+    "priority",
+    "due_date",
+    "assignees",
+    "url",
+]
+
+# ClickUp priority id -> emoji shown in the report's task list
+_PRIORITY_EMOJI = {"1": "🔴", "2": "🟡", "3": "🔵", "4": "⚪"}
+
 
 class TeamManagementCommands:
     """
@@ -17,6 +37,15 @@ class TeamManagementCommands:
     Only accessible to Admin, Manager, Director, and Executive roles.
     """
 
+    # Discord role names that grant access to admin commands
+    _ADMIN_ROLES = frozenset({"Manager", "Director", "Executive", "Admin"})
+
+    # Seconds between background refreshes of the autocomplete team names
+    TEAM_REFRESH_INTERVAL = 30
+
+    # Seconds a generated /team-report embed is reused for the same team
+    REPORT_CACHE_TTL = 60
+
     def __init__(self, bot, team_service, docs_service, discord_team_service):
         """
         Initialize team management commands.
@@ -32,6 +61,25 @@ class TeamManagementCommands:
         self.docs_service = docs_service
         self.discord_team_service = discord_team_service
 
+        # Short-lived cache of the teams table, keyed by query name.
+        # Autocomplete fires on every keystroke, so avoid a Supabase
+        # round-trip per character.
+        self._teams_cache: dict[str, tuple[float, list]] = {}
+
+        # Team names for autocomplete, kept fresh by a background task so
+        # keystrokes are answered from memory
+        self._team_names_cf: list[tuple[str, str]] = []
+        self._refresh_task: Optional[asyncio.Task] = None
+
+        # Admin role IDs per guild, built from _ADMIN_ROLES by name. Comparing
+        # IDs avoids string matching on every command and survives renames.
+        self._admin_role_ids: dict[int, frozenset[int]] = {}
+
+        # Rendered team reports keyed by team ID: (expires_at, embed dict).
+        # ClickUp data moves at the pace of minutes, so repeated /team-report
+        # calls within the TTL are served without refetching.
+        self._report_cache: dict[str, tuple[float, dict]] = {}
+
         logger.info("TeamManagementCommands initialized")
 
     def register_commands(self, tree: app_commands.CommandTree):
@@ -47,12 +95,100 @@ class TeamManagementCommands:
         tree.add_command(self._list_teams_command())
         logger.info("Team management commands registered")
 
-    async def _check_admin_access(
+    def start_team_refresh(self):
+        """Start refreshing autocomplete team names in the background."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_teams_loop())
+
+    def stop_team_refresh(self):
+        """Stop the background team name refresh."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    def _set_team_names(self, names):
+        """Store team names with their casefolded form for matching."""
+        self._team_names_cf = [(name, name.casefold()) for name in sorted(names)]
+
+    async def _refresh_teams_loop(self):
+        """Reload team names every TEAM_REFRESH_INTERVAL seconds."""
+        while True:
+            try:
+                self._teams_cache.clear()
+                teams = await self._get_teams_cached()
+                self._set_team_names(team["name"] for team in teams)
+            except Exception:
+                logger.exception("Failed to refresh team list")
+            await asyncio.sleep(self.TEAM_REFRESH_INTERVAL)
+
+    async def _run(self, fn, *args, **kwargs):
+        """
+        Run a blocking Supabase/Google call in a worker thread.
+
+        The data and docs clients are synchronous, so calling them directly
+        from a command handler would stall the event loop.
+        """
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def _get_teams_cached(self, ttl: float = 30) -> list[dict]:
+        """
+        Get all team rows, served from memory for up to ``ttl`` seconds.
+
+        Args:
+            ttl: Seconds a cached result stays valid
+
+        Returns:
+            List of team rows from the teams table
+        """
+        cached = self._teams_cache.get("all")
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        teams = await self._run(
+            lambda: self.team_service.data_service.client.table("teams")
+            .select("*")
+            .execute()
+            .data
+        )
+        self._teams_cache["all"] = (time.monotonic(), teams)
+        return teams
+
+    def refresh_admin_role_ids(self, guild: discord.Guild) -> None:
+        """
+        Rebuild the cached admin role IDs for a guild.
+
+        Args:
+            guild: Discord guild whose roles changed (or on startup)
+        """
+        self._admin_role_ids[guild.id] = frozenset(
+            role.id for role in guild.roles if role.name in self._ADMIN_ROLES
+        )
+
+    def _has_admin(self, member: discord.Member) -> bool:
+        """
+        Check whether a member holds one of the cached admin roles.
+
+        Args:
+            member: Guild member to check
+
+        Returns:
+            True if the member has Manager role or higher
+        """
+        if member.guild.id not in self._admin_role_ids:
+            self.refresh_admin_role_ids(member.guild)
+
+        member_role_ids = {role.id for role in member.roles}
+        return bool(member_role_ids & self._admin_role_ids[member.guild.id])
+
+    def _check_admin_access(
         self, interaction: discord.Interaction
     ) -> tuple[bool, Optional[str]]:
         """
         Check if user has admin access (Manager or above).
 
+        Runs synchronously against cached role IDs so unauthorized users are
+        rejected before the interaction is deferred.
+
         Args:
             interaction: Discord interaction
 
@@ -66,17 +202,74 @@ class TeamManagementCommands:
         if not member:
             return False, "Could not verify your server membership."
 
-        # Check for admin roles
-        admin_roles = ["Manager", "Director", "Executive", "Admin"]
-
-        user_roles = [role.name for role in member.roles]
-        has_access = any(role in user_roles for role in admin_roles)
-
-        if not has_access:
+        if not self._has_admin(member):
             return False, "This command requires Manager role or higher."
 
         return True, None
 
+    def _admin_only(self):
+        """
+        Command check that rejects non-admins at dispatch time.
+
+        Returns:
+            app_commands.check decorator
+        """
+
+        async def predicate(interaction: discord.Interaction) -> bool:
+            has_access, error_msg = self._check_admin_access(interaction)
+            if not has_access:
+                raise app_commands.CheckFailure(error_msg)
+            return True
+
+        return app_commands.check(predicate)
+
+    async def _on_admin_check_failure(
+        self, interaction: discord.Interaction, error: app_commands.AppCommandError
+    ):
+        """Tell the user why an admin command was rejected."""
+        if isinstance(error, app_commands.CheckFailure):
+            await interaction.response.send_message(str(error), ephemeral=True)
+
+    async def _safe_dm(self, member: discord.Member, embed: discord.Embed):
+        """Send a DM, logging instead of failing if the member blocks DMs."""
+        try:
+            await member.send(embed=embed)
+        except discord.Forbidden:
+            logger.warning(f"Could not send DM to {member.name}")
+
+    async def _perform_team_add(
+        self, team, db_member, role: str, make_team_lead: bool
+    ) -> bool:
+        """
+        Write a team membership and, if requested, the team lead.
+
+        Args:
+            team: Team being joined
+            db_member: TeamMember being added
+            role: Role within the team
+            make_team_lead: Whether to set the member as team lead
+
+        Returns:
+            True if the member was already on the team
+        """
+        _, created = await self._run(
+            self.team_service.data_service.upsert_member_to_team,
+            db_member.id,
+            team.id,
+            role=role,
+        )
+
+        if make_team_lead:
+            # Update team_lead_id in teams table
+            await self._run(
+                lambda: self.team_service.data_service.client.table("teams")
+                .update({"team_lead_id": str(db_member.id)})
+                .eq("id", str(team.id))
+                .execute()
+            )
+
+        return not created
+
     def _create_team_command(self) -> app_commands.Command:
         """Create the /create-team command."""
 
@@ -84,6 +277,7 @@ class TeamManagementCommands:
             name="create-team",
             description="[Admin] Create a new team with Discord roles, channels, and Google Drive folder",
         )
+        @self._admin_only()
         @app_commands.describe(
             team_name="Name of the team (e.g., Engineering, Product, Business)",
             team_color="Color for the Discord role",
@@ -110,20 +304,13 @@ class TeamManagementCommands:
             team_lead: discord.Member,
         ):
             """Create a new team with complete infrastructure."""
-            # Check admin access
-            has_access, error_msg = await self._check_admin_access(interaction)
-            if not has_access:
-                await interaction.response.send_message(error_msg, ephemeral=True)
-                return
-
             # Defer response since this will take time
             await interaction.response.defer(ephemeral=True)
 
             # Verify team lead is in database
-            team_lead_member = (
-                self.team_service.data_service.get_team_member_by_discord_id(
-                    team_lead.id
-                )
+            team_lead_member = await self._run(
+                self.team_service.data_service.get_team_member_by_discord_id,
+                team_lead.id,
             )
             if not team_lead_member:
                 await interaction.followup.send(
@@ -140,7 +327,9 @@ class TeamManagementCommands:
                     team_role,
                     manager_role,
                 ) = await self.discord_team_service.create_team_roles(
-                    interaction.guild, team_name, team_color
+                    interaction.guild,
+                    team_name,
+                    self.discord_team_service.get_color(team_color),
                 )
 
                 if not team_role or not manager_role:
@@ -150,27 +339,50 @@ class TeamManagementCommands:
                     )
                     return
 
-                # Step 2: Create Discord channels
+                # Steps 2-3: Discord channels (need the team role for overwrites)
+                # and the Google Drive folder (sync client, run in a thread) are
+                # independent, so create them concurrently.
                 logger.info(f"Creating Discord channels for team: {team_name}")
-                (
-                    general_channel,
-                    standup_channel,
-                ) = await self.discord_team_service.create_team_channels(
-                    interaction.guild, team_name, team_role
+                logger.info(f"Creating Google Drive folder for team: {team_name}")
+                channels_result, folder_result = await asyncio.gather(
+                    self.discord_team_service.create_team_channels(
+                        interaction.guild, team_name, team_role
+                    ),
+                    self._run(
+                        self.docs_service.create_team_folder_structure, team_name
+                    ),
+                    return_exceptions=True,
                 )
 
+                if isinstance(channels_result, BaseException):
+                    logger.error(
+                        f"Failed to create channels for {team_name}: {channels_result}"
+                    )
+                    channels_result = (None, None)
+                general_channel, standup_channel = channels_result
+
                 if not general_channel:
+                    # The Drive folder was created alongside the channels; don't
+                    # leave it orphaned when the team isn't going to exist
+                    if isinstance(folder_result, dict) and folder_result.get(
+                        "folder_id"
+                    ):
+                        await self._run(
+                            self.docs_service.delete_team_folder,
+                            folder_result["folder_id"],
+                        )
                     await interaction.followup.send(
                         f"❌ Failed to create Discord channels for {team_name}",
                         ephemeral=True,
                     )
                     return
 
-                # Step 3: Create Google Drive folder structure
-                logger.info(f"Creating Google Drive folder for team: {team_name}")
-                folder_result = self.docs_service.create_team_folder_structure(
-                    team_name
-                )
+                # Step 3: Check Google Drive folder structure
+                if isinstance(folder_result, BaseException):
+                    logger.error(
+                        f"Failed to create Drive folder for {team_name}: {folder_result}"
+                    )
+                    folder_result = None
 
                 if not folder_result:
                     await interaction.followup.send(
@@ -182,7 +394,8 @@ class TeamManagementCommands:
 
                 # Step 4: Create team in database with team lead
                 logger.info(f"Creating team record in database: {team_name}")
-                team = self.team_service.data_service.create_team(
+                team = await self._run(
+                    self.team_service.data_service.create_team,
                     name=team_name,
                     team_lead_id=team_lead_member.id,
                     description=description,
@@ -198,20 +411,42 @@ class TeamManagementCommands:
                     if standup_channel
                     else None,
                 )
+                self._teams_cache.clear()
+                self._report_cache.pop(str(team.id), None)
+                self.team_service.invalidate_memberships(team.id)
+                self._set_team_names(
+                    [*(name for name, _ in self._team_names_cf), team.name]
+                )
 
-                # Step 5: Assign team lead roles and add to team
+                # Step 5: Assign team lead roles, add to team, update roster and
+                # announce in the general channel. These don't depend on each
+                # other, so run them concurrently and log failures individually.
                 logger.info(f"Assigning team lead: {team_lead.name}")
-                # Add both team and manager roles to team lead
-                await team_lead.add_roles(team_role, manager_role)
-
-                # Add to team
-                self.team_service.data_service.add_member_to_team(
-                    team_lead_member.id, team.id, role=f"{team_name} Team Lead"
+                announce_embed = discord.Embed(
+                    title=f"🎉 Welcome to {team_name}!",
+                    description=f"{description}\n\nThis channel is for general team discussion and updates.",
+                    color=discord.Color.blue(),
+                )
+                announce_embed.add_field(
+                    name="Team Lead",
+                    value=f"{team_lead.mention}",
+                    inline=False,
                 )
 
-                # Update roster
+                follow_ups = {
+                    "assign team lead roles": team_lead.add_roles(
+                        team_role, manager_role
+                    ),
+                    "add team lead to team": self._run(
+                        self.team_service.data_service.add_member_to_team,
+                        team_lead_member.id,
+                        team.id,
+                        role=f"{team_name} Team Lead",
+                    ),
+                }
                 if folder_result.get("roster_sheet_id"):
-                    self.docs_service.add_member_to_roster(
+                    follow_ups["update roster"] = self._run(
+                        self.docs_service.add_member_to_roster,
                         roster_sheet_id=folder_result["roster_sheet_id"],
                         member_name=team_lead_member.name,
                         discord_username=team_lead_member.discord_username
@@ -220,6 +455,18 @@ class TeamManagementCommands:
                         role=f"{team_name} Team Lead",
                         profile_url=team_lead_member.profile_url or "",
                     )
+                follow_ups["post announcement"] = general_channel.send(
+                    embed=announce_embed
+                )
+
+                results = await asyncio.gather(
+                    *follow_ups.values(), return_exceptions=True
+                )
+                for step, result in zip(follow_ups, results):
+                    if isinstance(result, BaseException):
+                        logger.error(
+                            f"Failed to {step} for team {team_name}: {result}"
+                        )
 
                 # Build response
                 embed = discord.Embed(
@@ -229,22 +476,32 @@ class TeamManagementCommands:
                 )
 
                 # What was created
-                created_items = f"• Team Role: {team_role.mention} ({team_color})\n"
-                created_items += f"• Manager Role: {manager_role.mention}\n"
-                created_items += f"• Channels: {general_channel.mention}"
+                channels = general_channel.mention
                 if standup_channel:
-                    created_items += f", {standup_channel.mention}"
-                created_items += "\n"
+                    channels += f", {standup_channel.mention}"
+                created_lines = [
+                    f"• Team Role: {team_role.mention} ({team_color})",
+                    f"• Manager Role: {manager_role.mention}",
+                    f"• Channels: {channels}",
+                ]
 
                 if folder_result.get("folder_id"):
-                    created_items += f"• Google Drive Folder: [View Folder](https://drive.google.com/drive/folders/{folder_result['folder_id']})\n"
+                    created_lines.append(
+                        f"• Google Drive Folder: [View Folder](https://drive.google.com/drive/folders/{folder_result['folder_id']})"
+                    )
                 if folder_result.get("overview_doc_url"):
-                    created_items += f"• Team Overview: [View Document]({folder_result['overview_doc_url']})\n"
+                    created_lines.append(
+                        f"• Team Overview: [View Document]({folder_result['overview_doc_url']})"
+                    )
                 if folder_result.get("roster_sheet_url"):
-                    created_items += f"• Team Roster: [View Spreadsheet]({folder_result['roster_sheet_url']})\n"
+                    created_lines.append(
+                        f"• Team Roster: [View Spreadsheet]({folder_result['roster_sheet_url']})"
+                    )
 
                 if team_lead:
-                    created_items += f"• Team Lead: {team_lead.mention}\n"
+                    created_lines.append(f"• Team Lead: {team_lead.mention}")
+
+                created_items = "\n".join(created_lines) + "\n"
 
                 embed.add_field(
                     name="📋 What Was Created", value=created_items, inline=False
@@ -262,21 +519,6 @@ class TeamManagementCommands:
 
                 await interaction.followup.send(embed=embed, ephemeral=True)
 
-                # Post announcement to general channel
-                if general_channel:
-                    announce_embed = discord.Embed(
-                        title=f"🎉 Welcome to {team_name}!",
-                        description=f"{description}\n\nThis channel is for general team discussion and updates.",
-                        color=discord.Color.blue(),
-                    )
-                    if team_lead:
-                        announce_embed.add_field(
-                            name="Team Lead",
-                            value=f"{team_lead.mention}",
-                            inline=False,
-                        )
-                    await general_channel.send(embed=announce_embed)
-
                 logger.info(f"Successfully created team: {team_name}")
 
             except Exception as e:
@@ -285,6 +527,7 @@ class TeamManagementCommands:
                     f"❌ Error creating team: {str(e)}", ephemeral=True
                 )
 
+        create_team.error(self._on_admin_check_failure)
         return create_team
 
     def _add_to_team_command(self) -> app_commands.Command:
@@ -296,18 +539,16 @@ class TeamManagementCommands:
         ) -> list[app_commands.Choice[str]]:
             """Autocomplete teams from database."""
             try:
-                teams = (
-                    self.team_service.data_service.client.table("teams")
-                    .select("name")
-                    .execute()
-                )
-                team_names = [team["name"] for team in teams.data]
+                if not self._team_names_cf:
+                    # Background refresh hasn't completed yet
+                    teams = await self._get_teams_cached()
+                    self._set_team_names(team["name"] for team in teams)
 
                 # Filter based on what user is typing
-                if current:
-                    team_names = [
-                        name for name in team_names if current.lower() in name.lower()
-                    ]
+                needle = current.casefold()
+                team_names = [
+                    name for name, name_cf in self._team_names_cf if needle in name_cf
+                ]
 
                 return [
                     app_commands.Choice(name=name, value=name)
@@ -321,6 +562,7 @@ class TeamManagementCommands:
             name="add-to-team",
             description="[Admin] Add a member to a team or promote to team lead",
         )
+        @self._admin_only()
         @app_commands.describe(
             member="The member to add to the team",
             team_name="Name of the team",
@@ -336,28 +578,46 @@ class TeamManagementCommands:
             make_team_lead: bool = False,
         ):
             """Add a member to a team."""
-            # Check admin access
-            has_access, error_msg = await self._check_admin_access(interaction)
-            if not has_access:
-                await interaction.response.send_message(error_msg, ephemeral=True)
-                return
-
             await interaction.response.defer(ephemeral=True)
 
             try:
                 # Get team from database
-                team = self.team_service.data_service.get_team_by_name(team_name)
+                team = await self._run(
+                    self.team_service.data_service.get_team_by_name, team_name
+                )
                 if not team:
                     await interaction.followup.send(
                         f"❌ Team '{team_name}' not found in database.", ephemeral=True
                     )
                     return
 
+                # Resolve the team's Discord roles and channels once
+                guild = interaction.guild
+                team_role = (
+                    guild.get_role(team.discord_role_id)
+                    if team.discord_role_id
+                    else None
+                )
+                manager_role = (
+                    guild.get_role(team.discord_manager_role_id)
+                    if make_team_lead and team.discord_manager_role_id
+                    else None
+                )
+                general_channel = (
+                    guild.get_channel(team.discord_general_channel_id)
+                    if team.discord_general_channel_id
+                    else None
+                )
+                standup_channel = (
+                    guild.get_channel(team.discord_standup_channel_id)
+                    if team.discord_standup_channel_id
+                    else None
+                )
+
                 # Get member from database
-                db_member = (
-                    self.team_service.data_service.get_team_member_by_discord_id(
-                        member.id
-                    )
+                db_member = await self._run(
+                    self.team_service.data_service.get_team_member_by_discord_id,
+                    member.id,
                 )
                 if not db_member:
                     await interaction.followup.send(
@@ -366,82 +626,121 @@ class TeamManagementCommands:
                     )
                     return
 
-                # Check if already a member and just promoting to team lead
-                already_member = False
-                try:
-                    existing = (
-                        self.team_service.data_service.client.table("team_memberships")
-                        .select("*")
-                        .eq("member_id", str(db_member.id))
-                        .eq("team_id", str(team.id))
-                        .execute()
+                # Add to team in database (or update if already member).
+                # Shielded so a cancelled interaction can't leave the membership
+                # written without the team lead update.
+                final_role = role or ("Team Lead" if make_team_lead else "Team Member")
+                already_member = await asyncio.shield(
+                    self._perform_team_add(team, db_member, final_role, make_team_lead)
+                )
+                self._report_cache.pop(str(team.id), None)
+                self.team_service.invalidate_memberships(team.id)
+
+                # Discord roles the member doesn't have yet
+                roles_to_add = [
+                    r
+                    for r in (team_role, manager_role)
+                    if r and r not in member.roles
+                ]
+
+                # Build DM for the member
+                if make_team_lead:
+                    dm_embed = discord.Embed(
+                        title=f"🎖️ You've been promoted to Team Lead of {team_name}!",
+                        description=f"Congratulations! You now have manager permissions for the team.",
+                        color=discord.Color.gold(),
                     )
-                    already_member = len(existing.data) > 0
-                except:
-                    pass
-
-                # Add to team in database (or update if already member)
-                if not already_member:
-                    self.team_service.data_service.add_member_to_team(
-                        db_member.id,
-                        team.id,
-                        role=role or ("Team Lead" if make_team_lead else "Team Member"),
+                    dm_embed.add_field(
+                        name="Your Responsibilities",
+                        value="• Manage team messages and threads\n• Guide team members\n• Coordinate team activities",
+                        inline=False,
+                    )
+                else:
+                    dm_embed = discord.Embed(
+                        title=f"🎉 You've been added to {team_name}!",
+                        description=f"Welcome to the team! You now have access to team channels and resources.",
+                        color=discord.Color.blue(),
                     )
 
-                # Handle team lead promotion
-                is_team_lead = False
-                if make_team_lead:
-                    # Update team_lead_id in teams table
-                    self.team_service.data_service.client.table("teams").update(
-                        {"team_lead_id": str(db_member.id)}
-                    ).eq("id", str(team.id)).execute()
-                    is_team_lead = True
-
-                # Assign Discord roles
-                discord_role = None
-                manager_role = None
-                roles_to_add = []
-
-                if team.discord_role_id:
-                    discord_role = interaction.guild.get_role(team.discord_role_id)
-                    if discord_role and discord_role not in member.roles:
-                        roles_to_add.append(discord_role)
-
-                if make_team_lead and team.discord_manager_role_id:
-                    manager_role = interaction.guild.get_role(
-                        team.discord_manager_role_id
+                if role:
+                    dm_embed.add_field(name="Your Role", value=role, inline=False)
+
+                if general_channel:
+                    dm_embed.add_field(
+                        name="Team Channel",
+                        value=f"Join the conversation in {general_channel.mention}",
+                        inline=False,
                     )
-                    if manager_role and manager_role not in member.roles:
-                        roles_to_add.append(manager_role)
 
+                if db_member.profile_url:
+                    dm_embed.add_field(
+                        name="Your Profile",
+                        value=f"[View your profile document]({db_member.profile_url})",
+                        inline=False,
+                    )
+
+                if make_team_lead:
+                    welcome_msg = f"🎖️ {member.mention} has been promoted to Team Lead! Congrats! 🎉"
+                elif already_member:
+                    welcome_msg = f"📢 {member.mention}'s role has been updated"
+                    if role:
+                        welcome_msg += f" to {role}"
+                else:
+                    welcome_msg = f"👋 Welcome {member.mention} to the team!"
+                    if role:
+                        welcome_msg += f" ({role})"
+
+                # Assign Discord roles, update the roster, DM the member and post
+                # to the team channel concurrently - they are independent, and the
+                # membership is already saved, so one failing must not abort the
+                # others or the command. Failures are reported per step below.
+                follow_ups = {}
                 if roles_to_add:
-                    await member.add_roles(*roles_to_add)
+                    follow_ups["assign roles"] = member.add_roles(*roles_to_add)
 
-                # Update team roster in Google Sheets
-                roster_updated = False
                 if (
                     team.roster_sheet_id
                     and self.docs_service.is_available()
                     and not already_member
                 ):
-                    try:
-                        final_role = role or (
-                            "Team Lead" if make_team_lead else "Team Member"
-                        )
-                        self.docs_service.add_member_to_roster(
-                            roster_sheet_id=team.roster_sheet_id,
-                            member_name=db_member.name,
-                            discord_username=db_member.discord_username or member.name,
-                            email=db_member.email,
-                            role=final_role,
-                            profile_url=db_member.profile_url or "",
-                        )
-                        roster_updated = True
-                        logger.info(f"Added {db_member.name} to {team_name} roster")
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to update roster for {team_name}: {str(e)}"
+                    follow_ups["update roster"] = self._run(
+                        self.docs_service.add_member_to_roster,
+                        roster_sheet_id=team.roster_sheet_id,
+                        member_name=db_member.name,
+                        discord_username=db_member.discord_username or member.name,
+                        email=db_member.email,
+                        role=final_role,
+                        profile_url=db_member.profile_url or "",
+                    )
+
+                follow_ups["send DM"] = self._safe_dm(member, dm_embed)
+
+                if general_channel:
+                    follow_ups["post welcome message"] = general_channel.send(
+                        welcome_msg
+                    )
+
+                results = dict(
+                    zip(
+                        follow_ups,
+                        await asyncio.gather(
+                            *follow_ups.values(), return_exceptions=True
+                        ),
+                    )
+                )
+                failed_steps = []
+                for step, result in results.items():
+                    if isinstance(result, BaseException):
+                        logger.error(
+                            f"Failed to {step} for {member.name} in {team_name}: {result}"
                         )
+                        failed_steps.append(step)
+
+                roster_updated = results.get("update roster") is True
+                if roster_updated:
+                    logger.info(f"Added {db_member.name} to {team_name} roster")
+                elif "update roster" in results:
+                    logger.warning(f"Failed to update roster for {team_name}")
 
                 # Build response
                 if already_member and make_team_lead:
@@ -458,38 +757,51 @@ class TeamManagementCommands:
                     color=discord.Color.green(),
                 )
 
-                updates = ""
-                if discord_role:
-                    updates += f"• Team Role: ✅ {discord_role.mention} assigned\n"
+                update_lines = []
+                roles_failed = "assign roles" in failed_steps
+                if not team_role:
+                    update_lines.append("• Team Role: ⚠️ Role not found - assign manually")
+                elif roles_failed and team_role in roles_to_add:
+                    update_lines.append(
+                        f"• Team Role: ⚠️ Could not assign {team_role.mention} - assign manually"
+                    )
                 else:
-                    updates += "• Team Role: ⚠️ Role not found - assign manually\n"
+                    update_lines.append(f"• Team Role: ✅ {team_role.mention} assigned")
 
                 if manager_role:
-                    updates += f"• Manager Role: ✅ {manager_role.mention} assigned\n"
+                    if roles_failed and manager_role in roles_to_add:
+                        update_lines.append(
+                            f"• Manager Role: ⚠️ Could not assign {manager_role.mention} - assign manually"
+                        )
+                    else:
+                        update_lines.append(
+                            f"• Manager Role: ✅ {manager_role.mention} assigned"
+                        )
 
                 if roster_updated:
-                    updates += "• Team Roster: ✅ Added to spreadsheet\n"
+                    update_lines.append("• Team Roster: ✅ Added to spreadsheet")
                 elif already_member:
-                    updates += "• Team Roster: ℹ️ Already in roster\n"
+                    update_lines.append("• Team Roster: ℹ️ Already in roster")
                 else:
-                    updates += "• Team Roster: ⚠️ Update failed - check manually\n"
+                    update_lines.append(
+                        "• Team Roster: ⚠️ Update failed - check manually"
+                    )
 
                 # Add channel access info
-                if team.discord_general_channel_id:
-                    general_channel = interaction.guild.get_channel(
-                        team.discord_general_channel_id
+                if general_channel:
+                    channels = general_channel.mention
+                    if standup_channel:
+                        channels += f", {standup_channel.mention}"
+                    update_lines.append(f"• Channels: ✅ Can access {channels}")
+
+                if "send DM" in failed_steps:
+                    update_lines.append("• DM: ⚠️ Could not notify the member")
+                if "post welcome message" in failed_steps:
+                    update_lines.append(
+                        "• Announcement: ⚠️ Could not post in the team channel"
                     )
-                    if general_channel:
-                        updates += (
-                            f"• Channels: ✅ Can access {general_channel.mention}"
-                        )
-                        if team.discord_standup_channel_id:
-                            standup_channel = interaction.guild.get_channel(
-                                team.discord_standup_channel_id
-                            )
-                            if standup_channel:
-                                updates += f", {standup_channel.mention}"
-                        updates += "\n"
+
+                updates = "\n".join(update_lines) + "\n"
 
                 embed.add_field(name="📋 Updates", value=updates, inline=False)
 
@@ -498,69 +810,6 @@ class TeamManagementCommands:
 
                 await interaction.followup.send(embed=embed, ephemeral=True)
 
-                # Send DM to member
-                try:
-                    if make_team_lead:
-                        dm_embed = discord.Embed(
-                            title=f"🎖️ You've been promoted to Team Lead of {team_name}!",
-                            description=f"Congratulations! You now have manager permissions for the team.",
-                            color=discord.Color.gold(),
-                        )
-                        dm_embed.add_field(
-                            name="Your Responsibilities",
-                            value="• Manage team messages and threads\n• Guide team members\n• Coordinate team activities",
-                            inline=False,
-                        )
-                    else:
-                        dm_embed = discord.Embed(
-                            title=f"🎉 You've been added to {team_name}!",
-                            description=f"Welcome to the team! You now have access to team channels and resources.",
-                            color=discord.Color.blue(),
-                        )
-
-                    if role:
-                        dm_embed.add_field(name="Your Role", value=role, inline=False)
-
-                    if team.discord_general_channel_id:
-                        general_channel = interaction.guild.get_channel(
-                            team.discord_general_channel_id
-                        )
-                        if general_channel:
-                            dm_embed.add_field(
-                                name="Team Channel",
-                                value=f"Join the conversation in {general_channel.mention}",
-                                inline=False,
-                            )
-
-                    if db_member.profile_url:
-                        dm_embed.add_field(
-                            name="Your Profile",
-                            value=f"[View your profile document]({db_member.profile_url})",
-                            inline=False,
-                        )
-
-                    await member.send(embed=dm_embed)
-                except discord.Forbidden:
-                    logger.warning(f"Could not send DM to {member.name}")
-
-                # Post to team channel
-                if team.discord_general_channel_id:
-                    general_channel = interaction.guild.get_channel(
-                        team.discord_general_channel_id
-                    )
-                    if general_channel:
-                        if make_team_lead:
-                            welcome_msg = f"🎖️ {member.mention} has been promoted to Team Lead! Congrats! 🎉"
-                        elif already_member:
-                            welcome_msg = f"📢 {member.mention}'s role has been updated"
-                            if role:
-                                welcome_msg += f" to {role}"
-                        else:
-                            welcome_msg = f"👋 Welcome {member.mention} to the team!"
-                            if role:
-                                welcome_msg += f" ({role})"
-                        await general_channel.send(welcome_msg)
-
                 logger.info(f"Added {member.name} to team {team_name}")
 
             except Exception as e:
@@ -569,6 +818,7 @@ class TeamManagementCommands:
                     f"❌ Error adding member to team: {str(e)}", ephemeral=True
                 )
 
+        add_to_team.error(self._on_admin_check_failure)
         return add_to_team
 
     def _team_report_command(self) -> app_commands.Command:
@@ -582,6 +832,10 @@ class TeamManagementCommands:
             """Generate a daily report of team's ClickUp board status."""
             await interaction.response.defer(ephemeral=False)
 
+            # Placeholder shown while ClickUp is queried; edited in place with
+            # the finished report
+            report_msg = None
+
             try:
                 # Get the channel this was run in
                 channel = interaction.channel
@@ -590,24 +844,17 @@ class TeamManagementCommands:
                 team = None
                 if channel.category:
                     # Try to match channel category to team
-                    teams_response = (
-                        self.team_service.data_service.client.table("teams")
+                    teams_response = await self._run(
+                        lambda: self.team_service.data_service.client.table("teams")
                         .select("*")
+                        .or_(
+                            f"discord_general_channel_id.eq.{channel.id},"
+                            f"discord_standup_channel_id.eq.{channel.id}"
+                        )
+                        .limit(1)
                         .execute()
                     )
-                    for t in teams_response.data:
-                        if (
-                            t.get("discord_general_channel_id") == channel.id
-                            or t.get("discord_standup_channel_id") == channel.id
-                        ):
-                            team = (
-                                self.team_service.data_service.client.table("teams")
-                                .select("*")
-                                .eq("id", t["id"])
-                                .execute()
-                                .data[0]
-                            )
-                            break
+                    team = teams_response.data[0] if teams_response.data else None
 
                 if not team:
                     await interaction.followup.send(
@@ -617,7 +864,9 @@ class TeamManagementCommands:
                     return
 
                 # Check if user is team lead or admin
-                member = self.team_service.get_member_by_discord_id(interaction.user.id)
+                member = await self._run(
+                    self.team_service.get_member_by_discord_id, interaction.user.id
+                )
                 if not member:
                     await interaction.followup.send(
                         "❌ You must be onboarded to use this command.", ephemeral=True
@@ -642,9 +891,19 @@ class TeamManagementCommands:
                     )
                     return
 
+                cached = self._report_cache.get(str(team["id"]))
+                if cached and cached[0] > time.monotonic():
+                    logger.info(f"Team report cache hit for {team['name']}")
+                    await interaction.followup.send(
+                        embed=discord.Embed.from_dict(cached[1])
+                    )
+                    return
+                logger.info(f"Team report cache miss for {team['name']}")
+
                 # Get configured project lists for this team
-                list_ids = self.team_service.data_service.get_team_list_ids_by_name(
-                    team["name"]
+                list_ids = await self._run(
+                    self.team_service.data_service.get_team_list_ids_by_name,
+                    team["name"],
                 )
 
                 if not list_ids:
@@ -656,15 +915,12 @@ class TeamManagementCommands:
                     return
 
                 # Get team members to fetch their tasks
-                team_members_response = (
-                    self.team_service.data_service.client.table("team_memberships")
-                    .select("member_id")
-                    .eq("team_id", team["id"])
-                    .eq("is_active", True)
-                    .execute()
+                # Embed each member's ClickUp token via the member_id foreign key
+                memberships = await self._run(
+                    self.team_service.get_active_memberships, team["id"]
                 )
 
-                if not team_members_response.data:
+                if not memberships:
                     await interaction.followup.send(
                         f"⚠️ No active members found in team '{team['name']}'.",
                         ephemeral=True,
@@ -672,20 +928,15 @@ class TeamManagementCommands:
                     return
 
                 # Get any team member's ClickUp token to fetch tasks
-                from bot.services import ClickUpService
-
-                clickup_token = None
-                for tm in team_members_response.data:
-                    member_data = (
-                        self.team_service.data_service.client.table("team_members")
-                        .select("*")
-                        .eq("id", tm["member_id"])
-                        .execute()
-                        .data
-                    )
-                    if member_data and member_data[0].get("clickup_api_token"):
-                        clickup_token = member_data[0].get("clickup_api_token")
-                        break
+                clickup_token = next(
+                    (
+                        tm["team_members"]["clickup_api_token"]
+                        for tm in memberships
+                        if tm.get("team_members")
+                        and tm["team_members"].get("clickup_api_token")
+                    ),
+                    None,
+                )
 
                 if not clickup_token:
                     await interaction.followup.send(
@@ -708,9 +959,33 @@ class TeamManagementCommands:
                     )
                     return
 
-                # Fetch all tasks from configured lists
-                all_team_tasks = await clickup.get_all_tasks(
-                    assigned_only=False, list_ids=list_ids
+                report_msg = await interaction.followup.send(
+                    embed=discord.Embed(
+                        title=f"📊 {team['name']} Team Report",
+                        description="⏳ Fetching tasks from ClickUp...",
+                        color=discord.Color.blue(),
+                    ),
+                    wait=True,
+                )
+
+                # Fetch all tasks from configured lists alongside the member
+                # rows; the two calls are independent so they overlap
+                member_ids = [tm["member_id"] for tm in memberships]
+                all_team_tasks, member_rows = await asyncio.gather(
+                    clickup.get_all_tasks(
+                        assigned_only=False,
+                        list_ids=list_ids,
+                        fields=REPORT_TASK_FIELDS,
+                    ),
+                    self._run(
+                        lambda: self.team_service.data_service.client.table(
+                            "team_members"
+                        )
+                        .select("id, name, clickup_user_id")
+                        .in_("id", member_ids)
+                        .execute()
+                        .data
+                    ),
                 )
 
                 logger.info(
@@ -721,72 +996,55 @@ class TeamManagementCommands:
                 )
 
                 # Build a map of team member IDs for filtering
-                team_member_ids = set()
-                team_member_names = {}
-                for tm in team_members_response.data:
-                    member_data = (
-                        self.team_service.data_service.client.table("team_members")
-                        .select("id, name, clickup_user_id")
-                        .eq("id", tm["member_id"])
-                        .execute()
-                        .data
-                    )
-                    if member_data:
-                        member_obj = member_data[0]
-                        clickup_user_id = member_obj.get("clickup_user_id")
-                        if clickup_user_id:
-                            team_member_ids.add(str(clickup_user_id))
-                            team_member_names[str(clickup_user_id)] = member_obj.get(
-                                "name"
-                            )
-
-                # Track member task counts
-                member_task_counts = {}
-                for task in all_team_tasks:
-                    assignees = task.get("assignees", [])
-                    for assignee in assignees:
-                        assignee_id = str(assignee.get("id"))
-                        if assignee_id in team_member_ids:
-                            # Add member info to task
-                            task["_member_name"] = team_member_names.get(assignee_id)
-                            task["_member_id"] = assignee_id
 
-                            # Count tasks per member
-                            member_name = team_member_names.get(assignee_id)
-                            member_task_counts[member_name] = (
-                                member_task_counts.get(member_name, 0) + 1
-                            )
-                            break  # Only count each task once even if multiple team members assigned
+                team_member_names = {
+                    str(member_obj["clickup_user_id"]): member_obj.get("name")
+                    for member_obj in member_rows or []
+                    if member_obj.get("clickup_user_id")
+                }
+                team_member_ids = frozenset(team_member_names)
 
                 # Analyze tasks
                 total_tasks = len(all_team_tasks)
 
-                logger.info(
-                    f"Total tasks: {total_tasks}, Team member IDs: {team_member_ids}"
-                )
-                logger.info(f"Member task counts: {member_task_counts}")
-
                 if total_tasks == 0:
-                    await interaction.followup.send(
-                        f"📊 **{team['name']} Team Report**\n\n"
-                        f"No tasks found for this team. Team members may need to configure their ClickUp tokens or be assigned tasks."
+                    await report_msg.edit(
+                        content=f"📊 **{team['name']} Team Report**\n\n"
+                        f"No tasks found for this team. Team members may need to configure their ClickUp tokens or be assigned tasks.",
+                        embed=None,
                     )
                     return
 
-                # Group by status
-                status_counts = {}
-                priority_counts = {"urgent": 0, "high": 0, "normal": 0, "low": 0}
+                # Tag members and bucket status, priority and due dates in a
+                # single pass over the tasks
+                member_task_counts = Counter()
+                status_counts = Counter()
+                priority_counts = Counter(urgent=0, high=0, normal=0, low=0)
                 overdue_tasks = []
                 due_soon = []  # Due within 3 days
 
-                import datetime
-
                 now = datetime.datetime.now()
+                # ClickUp timestamps are in milliseconds; compare them as ints
+                now_ms = int(now.timestamp() * 1000)
+                day_ms = 86400 * 1000
 
                 for task in all_team_tasks:
+                    # Member
+                    for assignee in task.get("assignees", []):
+                        assignee_id = assignee.get("id")
+                        if assignee_id is None:
+                            continue
+                        assignee_id = str(assignee_id)
+                        if assignee_id in team_member_ids:
+                            member_name = team_member_names.get(assignee_id)
+                            task["_member_name"] = member_name
+                            task["_member_id"] = assignee_id
+                            member_task_counts[member_name] += 1
+                            break  # Only count each task once even if multiple team members assigned
+
                     # Status
                     status = task.get("status", {}).get("status", "Unknown")
-                    status_counts[status] = status_counts.get(status, 0) + 1
+                    status_counts[status] += 1
 
                     # Priority
                     priority = task.get("priority")
@@ -799,17 +1057,24 @@ class TeamManagementCommands:
                     due_date_str = task.get("due_date")
                     if due_date_str:
                         try:
-                            # ClickUp timestamps are in milliseconds
-                            due_date = datetime.datetime.fromtimestamp(
-                                int(due_date_str) / 1000
+                            due_ms = int(due_date_str)
+                        except (TypeError, ValueError) as e:
+                            logger.warning(
+                                f"Skipping invalid due date {due_date_str!r} on task {task.get('id')}: {e}"
                             )
-
-                            if due_date < now:
+                        else:
+                            if due_ms < now_ms:
                                 overdue_tasks.append(task)
-                            elif (due_date - now).days <= 3:
-                                due_soon.append(task)
-                        except:
-                            pass
+                            else:
+                                days_until = (due_ms - now_ms) // day_ms
+                                if days_until <= 3:
+                                    task["_days_until"] = days_until
+                                    due_soon.append(task)
+
+                logger.info(
+                    f"Total tasks: {total_tasks}, Team member IDs: {team_member_ids}"
+                )
+                logger.info(f"Member task counts: {member_task_counts}")
 
                 # Build report embed
                 embed = discord.Embed(
@@ -831,9 +1096,7 @@ class TeamManagementCommands:
                 # Status breakdown
                 if status_counts:
                     status_text = ""
-                    for status, count in sorted(
-                        status_counts.items(), key=lambda x: x[1], reverse=True
-                    ):
+                    for status, count in status_counts.most_common():
                         status_text += f"• **{status}**: {count}\n"
                     embed.add_field(
                         name="📋 Status Breakdown", value=status_text, inline=True
@@ -858,9 +1121,7 @@ class TeamManagementCommands:
                 # Member workload
                 if member_task_counts:
                     member_text = ""
-                    for member_name, count in sorted(
-                        member_task_counts.items(), key=lambda x: x[1], reverse=True
-                    )[:5]:
+                    for member_name, count in member_task_counts.most_common(5):
                         member_text += f"• **{member_name}**: {count} tasks\n"
                     if len(member_task_counts) > 5:
                         member_text += (
@@ -885,15 +1146,9 @@ class TeamManagementCommands:
                             assignee_name = assignees[0].get("username", "Unknown")
 
                         # Priority emoji
-                        priority = task.get("priority")
-                        priority_emoji = ""
-                        if priority:
-                            priority_emoji = {
-                                "1": "🔴",
-                                "2": "🟡",
-                                "3": "🔵",
-                                "4": "⚪",
-                            }.get(str(priority.get("id", "")), "")
+                        priority_emoji = _PRIORITY_EMOJI.get(
+                            str((task.get("priority") or {}).get("id", "")), ""
+                        )
 
                         task_url = task.get("url", "")
                         if task_url:
@@ -935,11 +1190,7 @@ class TeamManagementCommands:
                     for task in due_soon[:5]:
                         task_name = task.get("name", "Unnamed task")[:50]
                         member_name = task.get("_member_name", "Unknown")
-                        due_date_str = task.get("due_date")
-                        due_date = datetime.datetime.fromtimestamp(
-                            int(due_date_str) / 1000
-                        )
-                        days_until = (due_date - now).days
+                        days_until = task["_days_until"]
                         task_url = task.get("url", "")
                         if task_url:
                             due_soon_text += f"• [{task_name}]({task_url}) - {days_until}d ({member_name})\n"
@@ -957,7 +1208,11 @@ class TeamManagementCommands:
                     text=f"Generated by {interaction.user.name} • Use /team-report to refresh"
                 )
 
-                await interaction.followup.send(embed=embed)
+                self._report_cache[str(team["id"])] = (
+                    time.monotonic() + self.REPORT_CACHE_TTL,
+                    embed.to_dict(),
+                )
+                await report_msg.edit(embed=embed)
 
                 logger.info(
                     f"Generated team report for {team['name']} by {interaction.user.name}"
@@ -965,9 +1220,15 @@ class TeamManagementCommands:
 
             except Exception as e:
                 logger.error(f"Failed to generate team report: {str(e)}", exc_info=True)
-                await interaction.followup.send(
-                    f"❌ Error generating team report: {str(e)}", ephemeral=True
-                )
+                if report_msg:
+                    await report_msg.edit(
+                        content=f"❌ Error generating team report: {str(e)}",
+                        embed=None,
+                    )
+                else:
+                    await interaction.followup.send(
+                        f"❌ Error generating team report: {str(e)}", ephemeral=True
+                    )
 
         return team_report
 
@@ -978,20 +1239,15 @@ class TeamManagementCommands:
             name="list-teams",
             description="[Admin] List all teams and their members with roles",
         )
+        @self._admin_only()
         async def list_teams(interaction: discord.Interaction):
             """Display all teams and their members."""
-            # Check admin access
-            has_access, error_msg = await self._check_admin_access(interaction)
-            if not has_access:
-                await interaction.response.send_message(error_msg, ephemeral=True)
-                return
-
             await interaction.response.defer(ephemeral=True)
 
             try:
                 # Fetch all teams
-                teams_response = (
-                    self.team_service.data_service.client.table("teams")
+                teams_response = await self._run(
+                    lambda: self.team_service.data_service.client.table("teams")
                     .select("*")
                     .order("name")
                     .execute()
@@ -1013,8 +1269,10 @@ class TeamManagementCommands:
                     team_name = team["name"]
 
                     # Fetch team members directly from team_members table
-                    members_response = (
-                        self.team_service.data_service.client.table("team_members")
+                    members_response = await self._run(
+                        lambda: self.team_service.data_service.client.table(
+                            "team_members"
+                        )
                         .select("id, name, role")
                         .eq("team", team_name)
                         .eq("status", "active")
@@ -1075,4 +1333,5 @@ class TeamManagementCommands:
                     f"❌ Error listing teams: {str(e)}", ephemeral=True
                 )
 
+        list_teams.error(self._on_admin_check_failure)
         return list_teams
@@ -0,0 +1,31 @@
+"""
+Make the bot and shared-services packages importable from the scripts, and
+load discord-bot/.env.
+
+Import this first in each script (``import _bootstrap  # noqa: F401``); the
+scripts directory is already on sys.path when a script is run directly.
+"""
+
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# discord-bot/ (for the bot package)
+parent_dir = Path(__file__).parent.parent
+
+# shared-services/ and the data/docs service packages inside it
+shared_services_path = parent_dir.parent / "shared-services"
+
+for path in (
+    parent_dir,
+    shared_services_path,
+    shared_services_path / "data-service",
+    shared_services_path / "docs-service",
+):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+# Load discord-bot/.env directly rather than searching up from the caller;
+# existing environment variables take precedence
+load_dotenv(parent_dir / ".env", override=False)
@@ -13,28 +13,14 @@ Use this to start completely fresh.
 import asyncio
 import os
 import sys
-from pathlib import Path
 
 import discord
 from discord.ext import commands
 
-# Add parent directory to path
-parent_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(parent_dir))
+# Make bot and shared-services importable and load .env
+import _bootstrap  # noqa: F401
 
-# Add shared-services to path
-shared_services_path = parent_dir.parent / "shared-services"
-sys.path.insert(0, str(shared_services_path))
-sys.path.insert(0, str(shared_services_path / "data-service"))
-sys.path.insert(0, str(shared_services_path / "docs-service"))
-
-from data_service.models import TeamUpdate
-from dotenv import load_dotenv
-
-from bot.services import DocsService, TeamMemberService
-
-# Load environment variables
-load_dotenv()
+from bot.services import get_team_member_service
 
 
 class CleanupBot(commands.Bot):
@@ -48,7 +34,7 @@ class CleanupBot(commands.Bot):
 
         self.guild_id = int(os.getenv("DISCORD_GUILD_ID"))
         self.cleanup_complete = False
-        self.team_service = TeamMemberService()
+        self.team_service = get_team_member_service()
 
     async def on_ready(self):
         """Run cleanup when bot is ready."""
@@ -83,74 +69,62 @@ class CleanupBot(commands.Bot):
         print("This will help you clean up before fresh setup.")
         print()
 
-        # Step 1: Delete Discord roles
-        print("=" * 70)
-        print("STEP 1: Delete Discord Roles")
-        print("=" * 70)
-        print()
-
         # Get all teams from database
-        teams = self.team_service.data_service.list_teams()
-        team_names = [team.name for team in teams]
+        teams = self.team_service.data_service.list_team_names_and_ids()
+        team_names = [name for _, name in teams]
 
         print(f"Found {len(team_names)} teams in database:")
         for name in team_names:
             print(f"  • {name}")
         print()
 
+        # Ask every question up front, then run the chosen steps together
+        print("STEP 1: Delete Discord Roles")
         delete_roles = (
             input("Delete Discord roles for these teams? (yes/no): ").strip().lower()
         )
+        print()
 
-        if delete_roles == "yes":
-            if not guild.me.guild_permissions.manage_roles:
-                print("❌ Bot is missing 'Manage Roles' permission!")
-            else:
-                for team_name in team_names:
-                    try:
-                        role = discord.utils.get(guild.roles, name=team_name)
-                        if role:
-                            await role.delete(reason="Alfred cleanup")
-                            print(f"  ✅ Deleted Discord role: {team_name}")
-                        else:
-                            print(f"  ⏭️  Role not found: {team_name}")
-                    except Exception as e:
-                        print(f"  ❌ Error deleting role '{team_name}': {e}")
-        else:
-            print("⏭️  Skipped Discord role deletion")
-
-        # Step 2: Clear database references
-        print("\n" + "=" * 70)
         print("STEP 2: Clear Database References")
-        print("=" * 70)
-        print()
         print("This will clear Google Drive folder/sheet IDs from teams table.")
         print("(Does NOT delete the actual files in Google Drive)")
+        clear_db = input("Clear database references? (yes/no): ").strip().lower()
         print()
 
-        clear_db = input("Clear database references? (yes/no): ").strip().lower()
+        print("STEP 3: Delete Teams from Database (Optional)")
+        print("⚠️  WARNING: This will delete team records from database!")
+        print("Only do this if you want to completely remove these teams.")
+        delete_teams = input("Delete teams from database? (yes/no): ").strip().lower()
+        print()
+
+        print("=" * 70)
+        print("RUNNING CLEANUP")
+        print("=" * 70)
+        print()
 
-        if clear_db == "yes":
-            for team in teams:
-                try:
-                    update = TeamUpdate(
-                        drive_folder_id=None,
-                        overview_doc_id=None,
-                        overview_doc_url=None,
-                        roster_sheet_id=None,
-                        roster_sheet_url=None,
-                        discord_role_id=None,
-                    )
-                    self.team_service.data_service.update_team(team.id, update)
-                    print(f"  ✅ Cleared references for: {team.name}")
-                except Exception as e:
-                    print(f"  ❌ Error updating team '{team.name}': {e}")
+        steps = []
+        if delete_roles == "yes":
+            steps.append(self.delete_roles(guild, team_names))
         else:
-            print("⏭️  Skipped database cleanup")
+            print("⏭️  Skipped Discord role deletion")
+
+        if delete_teams == "yes":
+            # Deleting the rows removes their references too
+            steps.append(asyncio.to_thread(self.delete_teams, team_names))
+            if clear_db == "yes":
+                print("⏭️  Skipped clearing references (teams are being deleted)")
+        else:
+            print("⏭️  Skipped team deletion (teams kept in database)")
+            if clear_db == "yes":
+                steps.append(asyncio.to_thread(self.clear_references, teams))
+            else:
+                print("⏭️  Skipped database cleanup")
+
+        await asyncio.gather(*steps)
 
-        # Step 3: Show Google Drive folders to delete
+        # Google Drive folders have to be deleted by hand
         print("\n" + "=" * 70)
-        print("STEP 3: Google Drive Cleanup (Manual)")
+        print("Google Drive Cleanup (Manual)")
         print("=" * 70)
         print()
         print("📁 Google Drive folders to delete manually:")
@@ -166,34 +140,6 @@ class CleanupBot(commands.Bot):
             print(f"  • {team_name}")
         print()
         print("(You can also delete individual docs/sheets if needed)")
-        print()
-
-        # Step 4: Optional - Delete teams from database
-        print("=" * 70)
-        print("STEP 4: Delete Teams from Database (Optional)")
-        print("=" * 70)
-        print()
-        print("⚠️  WARNING: This will delete team records from database!")
-        print("Only do this if you want to completely remove these teams.")
-        print()
-
-        delete_teams = input("Delete teams from database? (yes/no): ").strip().lower()
-
-        if delete_teams == "yes":
-            from supabase import create_client
-
-            supabase = create_client(
-                os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_SERVICE_KEY")
-            )
-
-            for team_name in team_names:
-                try:
-                    supabase.table("teams").delete().eq("name", team_name).execute()
-                    print(f"  ✅ Deleted team from database: {team_name}")
-                except Exception as e:
-                    print(f"  ❌ Error deleting team '{team_name}': {e}")
-        else:
-            print("⏭️  Skipped team deletion (teams kept in database)")
 
         # Summary
         print("\n" + "=" * 70)
@@ -206,6 +152,66 @@ class CleanupBot(commands.Bot):
         print("  3. Configure your teams")
         print()
 
+    async def delete_roles(self, guild, team_names):
+        """Delete the Discord role for each team."""
+        if not guild.me.guild_permissions.manage_roles:
+            print("❌ Bot is missing 'Manage Roles' permission!")
+            return
+
+        roles = []
+        for team_name in team_names:
+            role = discord.utils.get(guild.roles, name=team_name)
+            if role:
+                roles.append(role)
+            else:
+                print(f"  ⏭️  Role not found: {team_name}")
+
+        # Let discord.py's rate limiter schedule the deletes together
+        results = await asyncio.gather(
+            *(role.delete(reason="Alfred cleanup") for role in roles),
+            return_exceptions=True,
+        )
+        for role, result in zip(roles, results):
+            if isinstance(result, Exception):
+                print(f"  ❌ Error deleting role '{role.name}': {result}")
+            else:
+                print(f"  ✅ Deleted Discord role: {role.name}")
+
+    def clear_references(self, teams):
+        """Clear Google Drive and Discord role IDs from the team rows."""
+        if not teams:
+            return
+
+        try:
+            self.team_service.data_service.client.table("teams").update(
+                {
+                    "drive_folder_id": None,
+                    "overview_doc_id": None,
+                    "overview_doc_url": None,
+                    "roster_sheet_id": None,
+                    "roster_sheet_url": None,
+                    "discord_role_id": None,
+                }
+            ).in_("id", [str(team_id) for team_id, _ in teams]).execute()
+            for _, team_name in teams:
+                print(f"  ✅ Cleared references for: {team_name}")
+        except Exception as e:
+            print(f"  ❌ Error clearing team references: {e}")
+
+    def delete_teams(self, team_names):
+        """Delete the team rows from the database."""
+        if not team_names:
+            return
+
+        try:
+            self.team_service.data_service.client.table("teams").delete().in_(
+                "name", team_names
+            ).execute()
+            for team_name in team_names:
+                print(f"  ✅ Deleted team from database: {team_name}")
+        except Exception as e:
+            print(f"  ❌ Error deleting teams: {e}")
+
 
 async def main():
     """Main cleanup function."""
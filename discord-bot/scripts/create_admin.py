@@ -1,24 +1,10 @@
 """Script to create an admin account with complete setup (bypasses onboarding)."""
 
 import os
-import sys
-from pathlib import Path
 from uuid import uuid4
 
-# Load environment variables from .env
-from dotenv import load_dotenv
-
-# Load .env from discord-bot directory
-env_path = Path(__file__).parent.parent / ".env"
-load_dotenv(env_path)
-
-# Add shared-services to path
-shared_services_path = Path(__file__).parent.parent.parent / "shared-services"
-sys.path.insert(0, str(shared_services_path))
-
-# Add bot directory to path
-bot_path = Path(__file__).parent.parent
-sys.path.insert(0, str(bot_path))
+# Make bot and shared-services importable and load .env
+import _bootstrap  # noqa: F401
 
 from data_service import create_data_service
 
@@ -56,6 +42,7 @@ def create_admin():
     data_service = create_data_service()
 
     # Check if user already exists
+    replace_member_id = None
     existing = data_service.get_team_member_by_discord_id(discord_id)
     if existing:
         print(f"\n⚠️  Account already exists: {existing.name} ({existing.email})")
@@ -65,20 +52,9 @@ def create_admin():
             input("\nDo you want to delete and recreate? (yes/no): ").strip().lower()
         )
         if overwrite == "yes":
-            # Delete from team_memberships first (foreign key constraint)
-            try:
-                data_service.client.table("team_memberships").delete().eq(
-                    "member_id", str(existing.id)
-                ).execute()
-                print(f"✅ Deleted team memberships")
-            except:
-                pass
-
-            # Delete from team_members
-            data_service.client.table("team_members").delete().eq(
-                "id", str(existing.id)
-            ).execute()
-            print(f"✅ Deleted existing account")
+            # Deleted together with the new record's insert in step 4
+            replace_member_id = str(existing.id)
+            print(f"✅ Existing account will be replaced")
         else:
             print("❌ Cancelled")
             return
@@ -162,7 +138,9 @@ def create_admin():
     else:
         print("\n3️⃣  Skipping main roster (no profile URL)")
 
-    # Step 4: Create team_members record using direct SQL (bypass Pydantic validation)
+    # Step 4: Create team_members record using direct SQL (bypass Pydantic validation).
+    # create_admin_member deletes the replaced account and inserts the new one
+    # in a single transaction.
     print("\n4️⃣  Creating database record...")
 
     try:
@@ -183,9 +161,10 @@ def create_admin():
         # Remove None values
         insert_data = {k: v for k, v in insert_data.items() if v is not None}
 
-        response = (
-            data_service.client.table("team_members").insert(insert_data).execute()
-        )
+        response = data_service.client.rpc(
+            "create_admin_member",
+            {"member_data": insert_data, "replace_member_id": replace_member_id},
+        ).execute()
 
         if response.data:
             admin = response.data[0]
@@ -5,9 +5,14 @@ import os
 from uuid import UUID
 
 import discord
-from dotenv import load_dotenv
 
-load_dotenv()
+# Make bot and shared-services importable and load .env
+import _bootstrap  # noqa: F401
+
+from data_service import create_data_service
+
+from bot.onboarding import ApprovalView
+from bot.services import get_docs_service, get_team_member_service
 
 DISCORD_BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN")
 ADMIN_CHANNEL_ID = int(os.getenv("DISCORD_ADMIN_CHANNEL_ID"))
@@ -22,6 +27,31 @@ print(f"Request ID: {REQUEST_ID}")
 print()
 
 
+def build_embed(pending, discord_user) -> discord.Embed:
+    """Build the admin notification embed for a pending request."""
+    embed = discord.Embed(
+        title="🆕 New Onboarding Request",
+        description=f"**{discord_user.mention}** wants to join the team!",
+        color=discord.Color.blue(),
+    )
+
+    embed.add_field(name="Discord User", value=str(discord_user), inline=False)
+    embed.add_field(name="Name", value=pending.name, inline=True)
+    embed.add_field(name="Email", value=pending.email, inline=True)
+
+    if pending.phone:
+        embed.add_field(name="Phone", value=pending.phone, inline=True)
+
+    # Only slice long bios; mark the cut so admins know it was truncated
+    bio_field = (
+        pending.bio if len(pending.bio) <= 1024 else pending.bio[:1021] + "..."
+    )
+    embed.add_field(name="Bio & Experience", value=bio_field, inline=False)
+    embed.set_thumbnail(url=discord_user.display_avatar.url)
+    embed.set_footer(text=f"Request ID: {pending.id}")
+    return embed
+
+
 async def main():
     intents = discord.Intents.default()
     intents.message_content = True
@@ -29,11 +59,28 @@ async def main():
 
     client = discord.Client(intents=intents)
 
+    async def load_request():
+        """Fetch the pending request, then its Discord user."""
+        data_service = create_data_service()
+        pending = await asyncio.to_thread(
+            data_service.get_pending_onboarding, REQUEST_ID
+        )
+        if not pending or pending.status.value != "pending":
+            return pending, None
+
+        try:
+            return pending, await client.fetch_user(pending.discord_id)
+        except Exception as e:
+            return pending, e
+
     @client.event
     async def on_ready():
         print(f"✅ Bot connected as {client.user}")
         print()
 
+        # Load the request and its Discord user while the channel checks run
+        request_task = asyncio.create_task(load_request())
+
         # Check admin channel
         print("📋 Step 1: Checking admin channel access...")
         admin_channel = client.get_channel(ADMIN_CHANNEL_ID)
@@ -46,11 +93,21 @@ async def main():
             print("2. Bot is not in the server")
             print("3. Bot doesn't have access to the channel")
             print()
+            request_task.cancel()
             print("Channels bot can see:")
-            for guild in client.guilds:
-                print(f"\n  Server: {guild.name}")
-                for channel in guild.text_channels:
-                    print(f"    - #{channel.name} (ID: {channel.id})")
+            print(
+                "\n".join(
+                    line
+                    for guild in client.guilds
+                    for line in (
+                        f"\n  Server: {guild.name}",
+                        *(
+                            f"    - #{channel.name} (ID: {channel.id})"
+                            for channel in guild.text_channels
+                        ),
+                    )
+                )
+            )
             await client.close()
             return
 
@@ -59,35 +116,28 @@ async def main():
 
         # Check permissions
         print("📋 Step 2: Checking bot permissions...")
-        permissions = admin_channel.permissions_for(admin_channel.guild.me)
-
-        print(f"   - Send Messages: {permissions.send_messages}")
-        print(f"   - Embed Links: {permissions.embed_links}")
-        print(f"   - Attach Files: {permissions.attach_files}")
-        print(f"   - Read Message History: {permissions.read_message_history}")
+        perms = admin_channel.permissions_for(admin_channel.guild.me).value
+        can_send = bool(perms & discord.Permissions.send_messages.flag)
+
+        print(f"   - Send Messages: {can_send}")
+        print(f"   - Embed Links: {bool(perms & discord.Permissions.embed_links.flag)}")
+        print(f"   - Attach Files: {bool(perms & discord.Permissions.attach_files.flag)}")
+        print(
+            "   - Read Message History: "
+            f"{bool(perms & discord.Permissions.read_message_history.flag)}"
+        )
 
-        if not permissions.send_messages:
+        if not can_send:
             print()
             print("❌ Bot doesn't have permission to send messages in this channel!")
             print("   Fix: Give bot 'Send Messages' permission in channel settings")
+            request_task.cancel()
             await client.close()
             return
 
         print()
         print("📋 Step 3: Getting pending request from database...")
-
-        # Import data service
-        import sys
-        from pathlib import Path
-
-        shared_services_path = Path.cwd().parent / "shared-services"
-        data_service_path = shared_services_path / "data-service"
-        sys.path.insert(0, str(data_service_path))
-
-        from data_service import create_data_service
-
-        data_service = create_data_service()
-        pending = data_service.get_pending_onboarding(REQUEST_ID)
+        pending, discord_user = await request_task
 
         if not pending:
             print(f"❌ Request {REQUEST_ID} not found")
@@ -108,41 +158,19 @@ async def main():
 
         # Get the Discord user
         print("📋 Step 4: Fetching Discord user...")
-        try:
-            discord_user = await client.fetch_user(pending.discord_id)
-            print(f"✅ Found user: {discord_user.name} ({discord_user.id})")
-        except Exception as e:
-            print(f"❌ Could not fetch user: {e}")
+        if isinstance(discord_user, Exception):
+            print(f"❌ Could not fetch user: {discord_user}")
             await client.close()
             return
+        print(f"✅ Found user: {discord_user.name} ({discord_user.id})")
 
         print()
         print("📋 Step 5: Sending admin notification...")
 
-        # Create embed
-        embed = discord.Embed(
-            title="🆕 New Onboarding Request",
-            description=f"**{discord_user.mention}** wants to join the team!",
-            color=discord.Color.blue(),
-        )
-
-        embed.add_field(name="Discord User", value=str(discord_user), inline=False)
-        embed.add_field(name="Name", value=pending.name, inline=True)
-        embed.add_field(name="Email", value=pending.email, inline=True)
-
-        if pending.phone:
-            embed.add_field(name="Phone", value=pending.phone, inline=True)
-
-        embed.add_field(name="Bio & Experience", value=pending.bio[:1024], inline=False)
-        embed.set_thumbnail(url=discord_user.display_avatar.url)
-        embed.set_footer(text=f"Request ID: {REQUEST_ID}")
-
-        # Import services
-        from bot.onboarding import ApprovalView
-        from bot.services import DocsService, TeamMemberService
+        embed = build_embed(pending, discord_user)
 
-        team_service = TeamMemberService()
-        docs_service = DocsService()
+        team_service = get_team_member_service()
+        docs_service = get_docs_service()
 
         # Create view with buttons
         view = ApprovalView(REQUEST_ID, pending.discord_id, team_service, docs_service)
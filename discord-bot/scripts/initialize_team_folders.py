@@ -13,25 +13,13 @@ Run this once to set up the folder structure for existing teams.
 import asyncio
 import os
 import sys
-from pathlib import Path
 
-# Add parent directory to path
-parent_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(parent_dir))
-
-# Add shared-services to path
-shared_services_path = parent_dir.parent / "shared-services"
-sys.path.insert(0, str(shared_services_path))
-sys.path.insert(0, str(shared_services_path / "data-service"))
-sys.path.insert(0, str(shared_services_path / "docs-service"))
+# Make bot and shared-services importable and load .env
+import _bootstrap  # noqa: F401
 
 from data_service.models import TeamUpdate
-from dotenv import load_dotenv
-
-from bot.services import DocsService, TeamMemberService
 
-# Load environment variables
-load_dotenv()
+from bot.services import get_docs_service, get_team_member_service
 
 
 def main():
@@ -39,8 +27,8 @@ def main():
     print("🚀 Starting team folder initialization...\n")
 
     # Initialize services
-    docs_service = DocsService()
-    team_service = TeamMemberService()
+    docs_service = get_docs_service()
+    team_service = get_team_member_service()
 
     if not docs_service.is_available():
         print("❌ Error: Google Docs service is not available")
@@ -56,51 +44,52 @@ def main():
         print("❌ Failed to create Team Management folder\n")
         return 1
 
-    # Get all teams from database
-    print("📋 Fetching teams from database...")
+    # Only fetch teams that still need a folder structure
+    print("📋 Fetching teams without folder structure from database...")
     try:
-        teams = team_service.data_service.list_teams()
-        print(f"Found {len(teams)} teams\n")
+        pending = team_service.data_service.list_teams_missing_structure()
+        print(f"Found {len(pending)} teams\n")
     except Exception as e:
         print(f"❌ Error fetching teams: {e}")
         return 1
 
-    # Initialize folder structure for each team
-    for team in teams:
-        print(f"🔧 Processing team: {team.name}")
+    # Create the folder structures concurrently
+    print(f"\n📁 Creating folder structures for {len(pending)} teams...\n")
+    results = docs_service.create_team_folder_structures([t.name for t in pending])
 
-        # Skip if team already has folder structure
-        if team.roster_sheet_id:
-            print(
-                f"  ⏭️  Team already has folder structure (roster: {team.roster_sheet_id})"
-            )
-            continue
-
-        try:
-            # Create team folder structure
-            print(f"  📁 Creating folder structure...")
-            result = docs_service.create_team_folder_structure(team.name)
-
-            if result:
-                print(f"  ✅ Created folder: {result['folder_id']}")
-                print(f"  ✅ Created overview doc: {result['overview_doc_url']}")
-                print(f"  ✅ Created roster sheet: {result['roster_sheet_url']}")
-
-                # Update team record in database
-                update = TeamUpdate(
-                    drive_folder_id=result["folder_id"],
-                    overview_doc_id=result["overview_doc_id"],
-                    overview_doc_url=result["overview_doc_url"],
-                    roster_sheet_id=result["roster_sheet_id"],
-                    roster_sheet_url=result["roster_sheet_url"],
+    folder_updates = []
+    for team in pending:
+        print(f"🔧 Processing team: {team.name}")
+        result = results.get(team.name)
+
+        if result:
+            print(f"  ✅ Created folder: {result['folder_id']}")
+            print(f"  ✅ Created overview doc: {result['overview_doc_url']}")
+            print(f"  ✅ Created roster sheet: {result['roster_sheet_url']}\n")
+
+            folder_updates.append(
+                (
+                    team,
+                    TeamUpdate(
+                        drive_folder_id=result["folder_id"],
+                        overview_doc_id=result["overview_doc_id"],
+                        overview_doc_url=result["overview_doc_url"],
+                        roster_sheet_id=result["roster_sheet_id"],
+                        roster_sheet_url=result["roster_sheet_url"],
+                    ),
                 )
+            )
+        else:
+            print(f"  ❌ Failed to create folder structure\n")
 
-                team_service.data_service.update_team(team.id, update)
-                print(f"  ✅ Updated team record in database\n")
-            else:
-                print(f"  ❌ Failed to create folder structure\n")
-        except Exception as e:
-            print(f"  ❌ Error: {e}\n")
+    # Update all team records in one request
+    try:
+        updated = team_service.data_service.update_teams(folder_updates)
+        if updated:
+            print(f"✅ Updated {len(updated)} team records in database\n")
+    except Exception as e:
+        print(f"❌ Error updating team records: {e}\n")
+        return 1
 
     print("🎉 Team folder initialization complete!")
     return 0
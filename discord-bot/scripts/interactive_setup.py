@@ -10,36 +10,41 @@ This script:
 5. Initializes Google Drive folder structure
 6. Links everything together
 
-Run this for initial setup or to add new teams.
+Run this for initial setup or to add new teams. Pass --config teams.json
+(team name -> {"description", "color"}) to skip the team prompts.
 """
 
+import argparse
 import asyncio
+import json
 import os
 import sys
-from pathlib import Path
-from uuid import UUID
+from collections import defaultdict
+from uuid import UUID, uuid4
 
 import discord
 from discord.ext import commands
 
-# Add parent directory to path
-parent_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(parent_dir))
-
-# Add shared-services to path
-shared_services_path = parent_dir.parent / "shared-services"
-sys.path.insert(0, str(shared_services_path))
-sys.path.insert(0, str(shared_services_path / "data-service"))
-sys.path.insert(0, str(shared_services_path / "docs-service"))
+# Make bot and shared-services importable and load .env
+import _bootstrap  # noqa: F401
 
 from data_service.models import TeamMemberCreate, TeamUpdate
-from dotenv import load_dotenv
 
-from bot.services import DocsService, TeamMemberService
+from bot.services import get_docs_service, get_team_member_service
+
 
-# Load environment variables
-load_dotenv()
+# Environment variables the setup can't run without
+REQUIRED_VARS = (
+    "DISCORD_BOT_TOKEN",
+    "DISCORD_GUILD_ID",
+    "SUPABASE_URL",
+    "SUPABASE_SERVICE_KEY",
+)
 
+# Seconds before a stalled setup run (e.g. a hung gateway connection) is
+# aborted. All prompts are answered before the bot starts, so this only
+# bounds the Discord and API work.
+SETUP_TIMEOUT = 600
 
 # Default team suggestions
 DEFAULT_TEAMS = {
@@ -77,7 +82,7 @@ COLOR_MAP = {
 class SetupBot(commands.Bot):
     """Temporary bot instance for setup."""
 
-    def __init__(self, teams_to_create):
+    def __init__(self, teams_to_create, admin_discord_id, admin_name, admin_email):
         intents = discord.Intents.default()
         intents.guilds = True
         intents.members = True
@@ -85,9 +90,12 @@ class SetupBot(commands.Bot):
 
         self.guild_id = int(os.getenv("DISCORD_GUILD_ID"))
         self.teams_to_create = teams_to_create
+        self.admin_discord_id = admin_discord_id
+        self.admin_name = admin_name
+        self.admin_email = admin_email
         self.setup_complete = False
-        self.team_service = TeamMemberService()
-        self.docs_service = DocsService()
+        self.team_service = get_team_member_service()
+        self.docs_service = get_docs_service()
 
     async def on_ready(self):
         """Run setup when bot is ready."""
@@ -120,32 +128,24 @@ class SetupBot(commands.Bot):
         print("STEP 1: Create Admin Account")
         print("=" * 70)
 
-        admin_discord_id = input(
-            "Enter your Discord ID (right-click profile → Copy ID): "
-        ).strip()
-        admin_name = input("Enter your full name: ").strip()
-        admin_email = input("Enter your email: ").strip()
-
-        if not admin_discord_id or not admin_name or not admin_email:
-            print("❌ All fields are required")
-            return
+        admin_name = self.admin_name
+        admin_email = self.admin_email
 
         try:
+            admin_id = int(self.admin_discord_id)
+
             # Check if admin already exists
-            existing_admin = self.team_service.get_member_by_discord_id(
-                int(admin_discord_id)
-            )
+            existing_admin = self.team_service.get_member_by_discord_id(admin_id)
             if existing_admin:
                 print(f"✅ Admin account already exists: {existing_admin.name}")
                 admin_member = existing_admin
             else:
-                from uuid import uuid4
-
+                admin_user = self.get_user(admin_id)
                 admin_data = TeamMemberCreate(
                     user_id=uuid4(),  # Temporary UUID
-                    discord_id=int(admin_discord_id),
-                    discord_username=str(self.get_user(int(admin_discord_id)))
-                    if self.get_user(int(admin_discord_id))
+                    discord_id=admin_id,
+                    discord_username=str(admin_user)
+                    if admin_user
                     else admin_email.split("@")[0],
                     name=admin_name,
                     email=admin_email,
@@ -165,42 +165,50 @@ class SetupBot(commands.Bot):
         print("STEP 2: Create Teams in Database")
         print("=" * 70)
 
-        from supabase import create_client
-
-        supabase = create_client(
-            os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_SERVICE_KEY")
-        )
+        # Reuse the data service's client and its connection pool
+        supabase = self.team_service.data_service.client
 
         created_teams = []
-        for team_name, team_info in self.teams_to_create.items():
-            try:
-                # Check if team exists
-                existing = (
-                    supabase.table("teams").select("*").eq("name", team_name).execute()
-                )
+        try:
+            # Look up every requested team in one query
+            existing_rows = (
+                supabase.table("teams")
+                .select("*")
+                .in_("name", list(self.teams_to_create.keys()))
+                .execute()
+                .data
+            )
+            by_name = {row["name"]: row for row in existing_rows}
 
-                if existing.data:
+            to_insert = []
+            for team_name, team_info in self.teams_to_create.items():
+                if team_name in by_name:
                     print(f"  ⏭️  Team '{team_name}' already exists in database")
-                    created_teams.append(existing.data[0])
+                    created_teams.append(by_name[team_name])
                 else:
-                    # Create team
-                    result = (
-                        supabase.table("teams")
-                        .insert(
-                            {
-                                "name": team_name,
-                                "description": team_info["description"],
-                            }
-                        )
-                        .execute()
+                    to_insert.append(
+                        {"name": team_name, "description": team_info["description"]}
                     )
-                    print(f"  ✅ Created team '{team_name}' in database")
-                    created_teams.append(result.data[0])
-            except Exception as e:
-                print(f"  ❌ Error creating team '{team_name}': {e}")
+
+            # Create the missing teams in one insert
+            if to_insert:
+                result = supabase.table("teams").insert(to_insert).execute()
+                for row in result.data:
+                    print(f"  ✅ Created team '{row['name']}' in database")
+                created_teams.extend(result.data)
+        except Exception as e:
+            print(f"  ❌ Error creating teams: {e}")
 
         print(f"\n✅ Total teams in database: {len(created_teams)}")
 
+        # Load teams once for the role and Drive steps below
+        all_teams = {
+            team.name: team for team in self.team_service.data_service.list_teams()
+        }
+
+        # Team fields to save after steps 3 and 4, keyed by team name
+        pending_updates = defaultdict(dict)
+
         # Step 3: Create Discord roles
         print("\n" + "=" * 70)
         print("STEP 3: Create Discord Roles (Team + Team Lead)")
@@ -213,113 +221,56 @@ class SetupBot(commands.Bot):
             print("   Then re-run this script")
             print("\n   Skipping role creation...")
         else:
-            for team_name, team_info in self.teams_to_create.items():
-                try:
-                    # Create base team role
-                    existing_role = discord.utils.get(guild.roles, name=team_name)
-                    if existing_role:
-                        print(f"  ⏭️  Discord role '{team_name}' already exists")
-                        role_id = existing_role.id
-                    else:
-                        color = COLOR_MAP.get(
-                            team_info["color"], discord.Color.default()
-                        )
-                        new_role = await guild.create_role(
-                            name=team_name,
-                            color=color,
-                            mentionable=True,
-                            reason="Alfred bot setup",
-                        )
-                        print(
-                            f"  ✅ Created Discord role '{team_name}' ({team_info['color']}, ID: {new_role.id})"
-                        )
-                        role_id = new_role.id
-
-                    # Update team in database with Discord role ID
-                    team = self.team_service.data_service.get_team_by_name(team_name)
-                    if team and not team.discord_role_id:
-                        update = TeamUpdate(discord_role_id=role_id)
-                        self.team_service.data_service.update_team(team.id, update)
-                        print(f"     → Updated database with Discord role ID")
-
-                    # Create Team Lead role
-                    team_lead_name = f"{team_name} Team Lead"
-                    existing_lead_role = discord.utils.get(guild.roles, name=team_lead_name)
-                    if existing_lead_role:
-                        print(f"  ⏭️  Discord role '{team_lead_name}' already exists")
-                    else:
-                        # Use same color but make it slightly different (hoisted)
-                        color = COLOR_MAP.get(
-                            team_info["color"], discord.Color.default()
-                        )
-                        new_lead_role = await guild.create_role(
-                            name=team_lead_name,
-                            color=color,
-                            mentionable=True,
-                            hoist=True,  # Display separately in member list
-                            reason="Alfred bot setup - Team Lead role",
-                        )
-                        print(
-                            f"  ✅ Created Discord role '{team_lead_name}' (Team Lead, ID: {new_lead_role.id})"
-                        )
-
-                except Exception as e:
-                    print(f"  ❌ Error creating roles for '{team_name}': {e}")
+            # Create roles for all teams concurrently; discord.py's rate
+            # limiter spaces out the requests
+            team_names = list(self.teams_to_create.keys())
+            roles_by_name = {role.name: role for role in guild.roles}
+            results = await asyncio.gather(
+                *(
+                    self._ensure_team_roles(
+                        guild,
+                        roles_by_name,
+                        team_name,
+                        team_info,
+                        all_teams.get(team_name),
+                        pending_updates,
+                    )
+                    for team_name, team_info in self.teams_to_create.items()
+                ),
+                return_exceptions=True,
+            )
+
+            for team_name, result in zip(team_names, results):
+                if isinstance(result, Exception):
+                    print(f"  ❌ Error creating roles for '{team_name}': {result}")
 
         # Step 4: Initialize Google Drive folders
         print("\n" + "=" * 70)
         print("STEP 4: Initialize Google Drive Folders")
         print("=" * 70)
 
+        drive_ready = True
         if not self.docs_service.is_available():
             print("⚠️  Google Docs service not available - skipping Drive setup")
             print("   Configure GOOGLE_CREDENTIALS_PATH to enable this feature")
         else:
-            # Create Team Management folder
-            print("\n📁 Creating Team Management folder...")
-            team_mgmt_folder = self.docs_service.get_team_management_folder()
-            if team_mgmt_folder:
-                print(f"✅ Team Management folder: {team_mgmt_folder}")
-            else:
-                print("❌ Failed to create Team Management folder")
-                return
-
-            # Create team folders
-            print("\n📁 Creating team folder structures...")
-
-            for team_name in self.teams_to_create.keys():
-                team = self.team_service.data_service.get_team_by_name(team_name)
-                if not team:
-                    print(f"  ⚠️  Team '{team_name}' not found in database")
-                    continue
-
-                # Skip if already has folder structure
-                if team.roster_sheet_id:
-                    print(f"  ⏭️  Team '{team_name}' already has folder structure")
-                    continue
-
-                print(f"\n  🔧 Setting up '{team_name}'...")
-                try:
-                    result = self.docs_service.create_team_folder_structure(team_name)
-                    if result:
-                        print(f"     ✅ Folder: {result['folder_id']}")
-                        print(f"     ✅ Overview: {result['overview_doc_url']}")
-                        print(f"     ✅ Roster: {result['roster_sheet_url']}")
-
-                        # Update team record
-                        update = TeamUpdate(
-                            drive_folder_id=result["folder_id"],
-                            overview_doc_id=result["overview_doc_id"],
-                            overview_doc_url=result["overview_doc_url"],
-                            roster_sheet_id=result["roster_sheet_id"],
-                            roster_sheet_url=result["roster_sheet_url"],
-                        )
-                        self.team_service.data_service.update_team(team.id, update)
-                        print(f"     ✅ Updated database")
-                    else:
-                        print(f"     ❌ Failed to create folder structure")
-                except Exception as e:
-                    print(f"     ❌ Error: {e}")
+            drive_ready = self._create_team_folders(all_teams, pending_updates)
+
+        # Save the role and folder IDs from steps 3 and 4 in one request
+        try:
+            updated = self.team_service.data_service.update_teams(
+                [
+                    (all_teams[team_name], TeamUpdate(**fields))
+                    for team_name, fields in pending_updates.items()
+                ]
+            )
+            if updated:
+                print(f"\n✅ Updated {len(updated)} team records in database")
+        except Exception as e:
+            print(f"\n❌ Error updating team records: {e}")
+
+        if not drive_ready:
+            return
 
         # Summary
         print("\n" + "=" * 70)
@@ -343,6 +294,124 @@ class SetupBot(commands.Bot):
         print("  3. Approve as admin in #admin-onboarding")
         print()
 
+    def _create_team_folders(self, all_teams, pending_updates):
+        """
+        Create Drive folder structures for teams that don't have one yet.
+
+        Folder IDs are added to ``pending_updates`` (team name -> fields) to
+        be saved with the other team updates.
+
+        Returns:
+            False if the Team Management folder couldn't be created
+        """
+        # Create Team Management folder
+        print("\n📁 Creating Team Management folder...")
+        team_mgmt_folder = self.docs_service.get_team_management_folder()
+        if team_mgmt_folder:
+            print(f"✅ Team Management folder: {team_mgmt_folder}")
+        else:
+            print("❌ Failed to create Team Management folder")
+            return False
+
+        # Create team folders
+        print("\n📁 Creating team folder structures...")
+
+        teams_with_roster = {
+            team.name for team in all_teams.values() if team.roster_sheet_id
+        }
+
+        pending = []
+        for team_name in self.teams_to_create:
+            # Skip if already has folder structure
+            if team_name in teams_with_roster:
+                print(f"  ⏭️  Team '{team_name}' already has folder structure")
+                continue
+
+            team = all_teams.get(team_name)
+            if not team:
+                print(f"  ⚠️  Team '{team_name}' not found in database")
+                continue
+
+            pending.append(team)
+
+        # Create the remaining teams' folders concurrently
+        results = self.docs_service.create_team_folder_structures(
+            [team.name for team in pending]
+        )
+
+        for team in pending:
+            print(f"\n  🔧 Setting up '{team.name}'...")
+            result = results.get(team.name)
+            if result:
+                print(f"     ✅ Folder: {result['folder_id']}")
+                print(f"     ✅ Overview: {result['overview_doc_url']}")
+                print(f"     ✅ Roster: {result['roster_sheet_url']}")
+
+                pending_updates[team.name].update(
+                    drive_folder_id=result["folder_id"],
+                    overview_doc_id=result["overview_doc_id"],
+                    overview_doc_url=result["overview_doc_url"],
+                    roster_sheet_id=result["roster_sheet_id"],
+                    roster_sheet_url=result["roster_sheet_url"],
+                )
+            else:
+                print(f"     ❌ Failed to create folder structure")
+
+        return True
+
+    async def _ensure_team_roles(
+        self, guild, roles_by_name, team_name, team_info, team, pending_updates
+    ):
+        """
+        Create the team role and Team Lead role if they don't exist.
+
+        ``roles_by_name`` maps the guild's role names to roles and is updated
+        with any roles created here. The base role's ID is added to
+        ``pending_updates`` as soon as the role exists (if ``team`` has none
+        yet), so it is saved even if creating the Team Lead role fails.
+        """
+        color = COLOR_MAP.get(team_info["color"], discord.Color.default())
+
+        # Create base team role
+        existing_role = roles_by_name.get(team_name)
+        if existing_role:
+            print(f"  ⏭️  Discord role '{team_name}' already exists")
+            role_id = existing_role.id
+        else:
+            new_role = await guild.create_role(
+                name=team_name,
+                color=color,
+                mentionable=True,
+                reason="Alfred bot setup",
+            )
+            roles_by_name[new_role.name] = new_role
+            print(
+                f"  ✅ Created Discord role '{team_name}' ({team_info['color']}, ID: {new_role.id})"
+            )
+            role_id = new_role.id
+
+        if team and not team.discord_role_id:
+            pending_updates[team_name]["discord_role_id"] = role_id
+
+        # Create Team Lead role
+        team_lead_name = f"{team_name} Team Lead"
+        existing_lead_role = roles_by_name.get(team_lead_name)
+        if existing_lead_role:
+            print(f"  ⏭️  Discord role '{team_lead_name}' already exists")
+        else:
+            # Use same color but make it slightly different (hoisted)
+            new_lead_role = await guild.create_role(
+                name=team_lead_name,
+                color=color,
+                mentionable=True,
+                hoist=True,  # Display separately in member list
+                reason="Alfred bot setup - Team Lead role",
+            )
+            roles_by_name[new_lead_role.name] = new_lead_role
+            print(
+                f"  ✅ Created Discord role '{team_lead_name}' (Team Lead, ID: {new_lead_role.id})"
+            )
+
 
 def get_teams_from_user():
     """Interactive prompt to get teams from user."""
@@ -398,25 +467,30 @@ def get_teams_from_user():
         print("Available colors:", ", ".join(COLOR_MAP.keys()))
         print()
 
-        teams = {}
-        while True:
-            name = input("Team name (or press Enter to finish): ").strip()
-            if not name:
+        print("Enter one team per line as 'name|description|color'")
+        print("(description and color are optional; blank line to finish):")
+
+        # Read the whole block at once so teams can be pasted in
+        lines = []
+        for line in sys.stdin:
+            if not line.strip():
                 break
+            lines.append(line)
 
-            description = input(f"Description for {name}: ").strip()
-            color = (
-                input(f"Color for {name} ({', '.join(list(COLOR_MAP.keys())[:6])}): ")
-                .strip()
-                .lower()
+        teams = {}
+        for line in lines:
+            name, description, color = (
+                part.strip() for part in (line.split("|", 2) + ["", ""])[:3]
             )
+            if not name:
+                continue
 
+            color = color.lower() or "blue"
             if color not in COLOR_MAP:
                 color = "blue"
-                print(f"  ⚠️  Invalid color, using 'blue'")
+                print(f"  ⚠️  Invalid color for {name}, using 'blue'")
 
             teams[name] = {"description": description or f"{name} team", "color": color}
-            print(f"  ✅ Added {name}\n")
 
         if teams:
             print(f"\n✅ Created {len(teams)} custom teams:")
@@ -432,30 +506,67 @@ def get_teams_from_user():
         return None
 
 
+def load_teams_from_config(config_path):
+    """
+    Load teams from a JSON file instead of prompting.
+
+    The file maps team names to {"description": ..., "color": ...}.
+    Unknown colors fall back to blue, as in the interactive prompt.
+    """
+    with open(config_path) as f:
+        config = json.load(f)
+
+    teams = {
+        name: {
+            "description": (info or {}).get("description") or f"{name} team",
+            "color": ((info or {}).get("color") or "blue").lower(),
+        }
+        for name, info in config.items()
+    }
+
+    bad_colors = [
+        name for name, info in teams.items() if info["color"] not in COLOR_MAP
+    ]
+    for name in bad_colors:
+        print(f"  ⚠️  Invalid color for {name}, using 'blue'")
+        teams[name]["color"] = "blue"
+
+    print(f"✅ Loaded {len(teams)} teams from {config_path}:")
+    for name, info in teams.items():
+        print(f"  • {name} ({info['color']}) - {info['description']}")
+    return teams
+
+
 async def main():
     """Main setup function."""
+    parser = argparse.ArgumentParser(description="Alfred Bot interactive setup")
+    parser.add_argument(
+        "--config", help="JSON file of teams to create (skips the team prompts)"
+    )
+    args = parser.parse_args()
+
     print("\n" + "=" * 70)
     print(" 🚀 Alfred Bot - Interactive Setup")
     print("=" * 70)
     print()
 
     # Check environment variables
-    required_vars = [
-        "DISCORD_BOT_TOKEN",
-        "DISCORD_GUILD_ID",
-        "SUPABASE_URL",
-        "SUPABASE_SERVICE_KEY",
-    ]
-
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    missing_vars = [var for var in REQUIRED_VARS if not os.environ.get(var)]
     if missing_vars:
         print("❌ Error: Missing required environment variables:")
         for var in missing_vars:
             print(f"   - {var}")
         return 1
 
-    # Get teams from user
-    teams = get_teams_from_user()
+    # Get teams from the config file or the user
+    if args.config:
+        try:
+            teams = load_teams_from_config(args.config)
+        except (OSError, ValueError) as e:
+            print(f"❌ Error reading {args.config}: {e}")
+            return 1
+    else:
+        teams = get_teams_from_user()
     if not teams:
         print("\n❌ Setup cancelled - no teams configured")
         return 1
@@ -472,11 +583,32 @@ async def main():
         print("❌ Setup cancelled")
         return 1
 
+    # Ask for the admin details up front so the setup timeout doesn't run
+    # while waiting on the operator
+    print()
+    admin_discord_id = input(
+        "Enter your Discord ID (right-click profile → Copy ID): "
+    ).strip()
+    admin_name = input("Enter your full name: ").strip()
+    admin_email = input("Enter your email: ").strip()
+
+    if not admin_discord_id or not admin_name or not admin_email:
+        print("❌ All fields are required")
+        return 1
+
     # Create and run bot
-    bot = SetupBot(teams)
+    bot = SetupBot(teams, admin_discord_id, admin_name, admin_email)
 
     try:
-        await bot.start(os.getenv("DISCORD_BOT_TOKEN"))
+        async with asyncio.timeout(SETUP_TIMEOUT):
+            await bot.start(os.getenv("DISCORD_BOT_TOKEN"))
+    except TimeoutError:
+        print(f"\n❌ Setup timed out after {SETUP_TIMEOUT} seconds")
+        await bot.close()
+        return 1
+    except asyncio.CancelledError:
+        await bot.close()
+        raise
     except KeyboardInterrupt:
         print("\n❌ Setup cancelled by user")
         await bot.close()
@@ -12,22 +12,49 @@ Run this to start fresh for testing.
 
 import os
 import sys
-from pathlib import Path
 
-# Add parent directory to path
-parent_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(parent_dir))
+# Make bot and shared-services importable and load .env
+import _bootstrap  # noqa: F401
 
-# Add shared-services to path
-shared_services_path = parent_dir.parent / "shared-services"
-sys.path.insert(0, str(shared_services_path))
-sys.path.insert(0, str(shared_services_path / "data-service"))
+from bot.services import get_team_member_service
 
-from dotenv import load_dotenv
-from supabase import create_client
+# IDs are sent in the request URL, so keep each IN (...) list well under
+# typical URL length limits
+DELETE_CHUNK_SIZE = 200
 
-# Load environment variables
-load_dotenv()
+
+def bulk_delete(supabase, table, keep_discord_id=None, chunk=DELETE_CHUNK_SIZE):
+    """
+    Delete all rows from a table by ID, in chunks.
+
+    Selects up to ``chunk`` IDs at a time and deletes them, repeating until
+    none are left, so tables larger than PostgREST's max_rows are fully
+    cleared.
+
+    Args:
+        supabase: Supabase client
+        table: Table name
+        keep_discord_id: Discord ID whose rows should be kept
+        chunk: Maximum number of IDs per delete request
+
+    Returns:
+        Number of rows deleted
+    """
+    deleted = 0
+    while True:
+        query = supabase.table(table).select("id")
+        if keep_discord_id is not None:
+            query = query.neq("discord_id", keep_discord_id)
+        ids = [row["id"] for row in query.limit(chunk).execute().data]
+        if not ids:
+            return deleted
+
+        response = supabase.table(table).delete().in_("id", ids).execute()
+        if not response.data:
+            # Nothing was removed (e.g. blocked by RLS); stop instead of
+            # selecting the same rows forever
+            raise RuntimeError(f"Could not delete rows from {table}")
+        deleted += len(response.data)
 
 
 def main():
@@ -44,9 +71,13 @@ def main():
 
     # Get admin Discord ID to preserve
     print()
-    preserve_admin = input(
-        "Enter admin Discord ID to preserve (or press Enter to delete all): "
-    )
+    while True:
+        preserve_admin = input(
+            "Enter admin Discord ID to preserve (or press Enter to delete all): "
+        ).strip()
+        if not preserve_admin or preserve_admin.isdigit():
+            break
+        print("❌ Discord IDs are numeric, please try again")
 
     # Initialize Supabase
     supabase_url = os.getenv("SUPABASE_URL")
@@ -56,50 +87,27 @@ def main():
         print("❌ Error: SUPABASE_URL or SUPABASE_SERVICE_KEY not found in .env")
         return 1
 
-    supabase = create_client(supabase_url, supabase_key)
+    # Share the data service's client so every delete reuses its connections
+    supabase = get_team_member_service().data_service.client
 
     print()
     print("🗑️  Deleting records...")
 
-    # Delete pending_onboarding records
-    try:
-        if preserve_admin:
-            result = (
-                supabase.table("pending_onboarding")
-                .delete()
-                .neq("discord_id", int(preserve_admin))
-                .execute()
-            )
-        else:
-            result = (
-                supabase.table("pending_onboarding")
-                .delete()
-                .neq("id", "00000000-0000-0000-0000-000000000000")
-                .execute()
-            )
-        print(f"✅ Deleted pending_onboarding records")
-    except Exception as e:
-        print(f"⚠️  Error deleting pending_onboarding: {e}")
-
-    # Delete team_members records
-    try:
-        if preserve_admin:
-            result = (
-                supabase.table("team_members")
-                .delete()
-                .neq("discord_id", int(preserve_admin))
-                .execute()
-            )
-        else:
-            result = (
-                supabase.table("team_members")
-                .delete()
-                .neq("id", "00000000-0000-0000-0000-000000000000")
-                .execute()
-            )
-        print(f"✅ Deleted team_members records")
-    except Exception as e:
-        print(f"⚠️  Error deleting team_members: {e}")
+    if preserve_admin:
+        keep_discord_id = int(preserve_admin)
+        for table in ("pending_onboarding", "team_members"):
+            try:
+                deleted = bulk_delete(supabase, table, keep_discord_id)
+                print(f"✅ Deleted {deleted} {table} records")
+            except Exception as e:
+                print(f"⚠️  Error deleting {table}: {e}")
+    else:
+        # Nothing to keep, so clear both tables in one call
+        try:
+            supabase.rpc("reset_onboarding_tables").execute()
+            print("✅ Deleted pending_onboarding and team_members records")
+        except Exception as e:
+            print(f"⚠️  Error resetting tables: {e}")
 
     print()
     print("🎉 Database reset complete!")
@@ -10,50 +10,56 @@ This script:
 5. Initializes Google Drive folder structure for teams
 6. Links everything together
 
-Run this once for initial setup or after database reset.
+Run this once for initial setup or after database reset. Pass
+--admin-discord-id, --admin-name and --admin-email to skip the prompts.
 """
 
+import argparse
 import asyncio
 import os
 import sys
-from pathlib import Path
 from uuid import UUID
 
 import discord
 from discord.ext import commands
 
-# Add parent directory to path
-parent_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(parent_dir))
-
-# Add shared-services to path
-shared_services_path = parent_dir.parent / "shared-services"
-sys.path.insert(0, str(shared_services_path))
-sys.path.insert(0, str(shared_services_path / "data-service"))
-sys.path.insert(0, str(shared_services_path / "docs-service"))
+# Make bot and shared-services importable and load .env
+import _bootstrap  # noqa: F401
 
 from data_service.models import TeamMemberCreate, TeamUpdate
-from dotenv import load_dotenv
 
-from bot.services import DocsService, TeamMemberService
+from bot.services import get_docs_service, get_team_member_service
+
+# Discord role colors for each team
+TEAM_ROLE_COLORS = {
+    "Engineering": discord.Color.blue(),
+    "Product": discord.Color.green(),
+    "Business": discord.Color.gold(),
+    "Marketing": discord.Color.purple(),
+    "Sales": discord.Color.orange(),
+    "Operations": discord.Color.teal(),
+}
 
-# Load environment variables
-load_dotenv()
+# Teams that get a Google Drive folder structure
+PRIMARY_TEAMS = ["Engineering", "Product", "Business"]
 
 
 class SetupBot(commands.Bot):
     """Temporary bot instance for setup."""
 
-    def __init__(self):
+    def __init__(self, admin_discord_id, admin_name, admin_email):
         intents = discord.Intents.default()
         intents.guilds = True
         intents.members = True
         super().__init__(command_prefix="!", intents=intents)
 
         self.guild_id = int(os.getenv("DISCORD_GUILD_ID"))
+        self.admin_discord_id = admin_discord_id
+        self.admin_name = admin_name
+        self.admin_email = admin_email
         self.setup_complete = False
-        self.team_service = TeamMemberService()
-        self.docs_service = DocsService()
+        self.team_service = get_team_member_service()
+        self.docs_service = get_docs_service()
 
     async def on_ready(self):
         """Run setup when bot is ready."""
@@ -78,28 +84,37 @@ class SetupBot(commands.Bot):
             self.setup_complete = True
             await self.close()
 
+    async def _create_roles(self, guild, team_names):
+        """Create the Discord roles for the given teams concurrently."""
+        # discord.py's rate limiter spaces out the requests
+        return await asyncio.gather(
+            *(
+                guild.create_role(
+                    name=team_name,
+                    color=TEAM_ROLE_COLORS[team_name],
+                    mentionable=True,
+                    reason="Alfred bot setup",
+                )
+                for team_name in team_names
+            ),
+            return_exceptions=True,
+        )
+
     async def run_setup(self, guild):
         """Run the complete setup process."""
+        admin_discord_id = self.admin_discord_id
+        admin_name = self.admin_name
+        admin_email = self.admin_email
 
         # Step 1: Create admin account
         print("=" * 60)
         print("STEP 1: Create Admin Account")
         print("=" * 60)
 
-        admin_discord_id = input(
-            "Enter your Discord ID (right-click profile → Copy ID): "
-        ).strip()
-        admin_name = input("Enter your full name: ").strip()
-        admin_email = input("Enter your email: ").strip()
-
-        if not admin_discord_id or not admin_name or not admin_email:
-            print("❌ All fields are required")
-            return
-
         try:
             # Check if admin already exists
-            existing_admin = self.team_service.get_member_by_discord_id(
-                int(admin_discord_id)
+            existing_admin = await asyncio.to_thread(
+                self.team_service.get_member_by_discord_id, int(admin_discord_id)
             )
             if existing_admin:
                 print(f"✅ Admin account already exists: {existing_admin.name}")
@@ -118,8 +133,8 @@ class SetupBot(commands.Bot):
                     role="Admin",
                     team="Leadership",
                 )
-                admin_member = self.team_service.data_service.create_team_member(
-                    admin_data
+                admin_member = await asyncio.to_thread(
+                    self.team_service.data_service.create_team_member, admin_data
                 )
                 print(f"✅ Created admin account: {admin_member.name}")
         except Exception as e:
@@ -140,76 +155,93 @@ class SetupBot(commands.Bot):
             "Operations",
         ]
 
-        created_teams = []
+        # Get all teams from database in one request
+        try:
+            all_teams = await asyncio.to_thread(
+                self.team_service.data_service.list_teams
+            )
+        except Exception as e:
+            print(f"❌ Error fetching teams: {e}")
+            return
+        teams_by_name = {team.name: team for team in all_teams}
+
+        # The checks above passed, so start creating missing Discord roles in
+        # the background while the rest of step 2 runs. Once started the task
+        # is always awaited in step 3 and its role IDs saved, so a rerun
+        # never creates duplicates.
+        role_names = {role.name for role in guild.roles}
+        new_team_names = [name for name in TEAM_ROLE_COLORS if name not in role_names]
+        can_manage_roles = guild.me.guild_permissions.manage_roles
+        roles_task = None
+        if new_team_names and can_manage_roles:
+            roles_task = asyncio.create_task(self._create_roles(guild, new_team_names))
+
         for team_name in teams_to_create:
-            try:
-                existing_team = self.team_service.data_service.get_team_by_name(
-                    team_name
+            if team_name in teams_by_name:
+                print(f"  ⏭️  Team '{team_name}' already exists")
+            else:
+                # Teams are created by migration, just verify they exist
+                print(
+                    f"  ⚠️  Team '{team_name}' not found - should be created by migration"
                 )
-                if existing_team:
-                    print(f"  ⏭️  Team '{team_name}' already exists")
-                    created_teams.append(existing_team)
-                else:
-                    # Teams are created by migration, just verify they exist
-                    print(
-                        f"  ⚠️  Team '{team_name}' not found - should be created by migration"
-                    )
-            except Exception as e:
-                print(f"  ⚠️  Error checking team '{team_name}': {e}")
 
-        # Get all teams from database
-        all_teams = self.team_service.data_service.list_teams()
         print(f"\n✅ Found {len(all_teams)} teams in database")
 
+        # Work out up front which teams step 4 still has to create folders for
+        pending = []
+        for team_name in PRIMARY_TEAMS:
+            team = teams_by_name.get(team_name)
+            if not team:
+                print(f"  ⚠️  Team '{team_name}' not found in database")
+            elif team.roster_sheet_id:
+                print(f"  ⏭️  Team '{team_name}' already has folder structure")
+            else:
+                pending.append(team)
+
+        if not new_team_names and not pending:
+            print("\n✅ Discord roles and Drive folders are already set up")
+            print("   Nothing left to do 🎉")
+            return
+
         # Step 3: Create Discord roles
         print("\n" + "=" * 60)
         print("STEP 3: Create Discord Roles")
         print("=" * 60)
 
-        # Check if bot has Manage Roles permission
-        if not guild.me.guild_permissions.manage_roles:
+        for team_name in TEAM_ROLE_COLORS:
+            if team_name not in new_team_names:
+                print(f"  ⏭️  Discord role '{team_name}' already exists")
+
+        if not new_team_names:
+            print("  ✅ All Discord roles already exist")
+        elif not can_manage_roles:
             print("❌ Bot is missing 'Manage Roles' permission!")
             print("   Please give the bot 'Manage Roles' permission in Server Settings")
             print("   Then re-run this script")
             print("\n   Skipping role creation...")
         else:
-            role_colors = {
-                "Engineering": discord.Color.blue(),
-                "Product": discord.Color.green(),
-                "Business": discord.Color.gold(),
-                "Marketing": discord.Color.purple(),
-                "Sales": discord.Color.orange(),
-                "Operations": discord.Color.teal(),
-            }
-
-            for team_name, color in role_colors.items():
-                try:
-                    # Check if role exists
-                    existing_role = discord.utils.get(guild.roles, name=team_name)
-                    if existing_role:
-                        print(f"  ⏭️  Discord role '{team_name}' already exists")
-                    else:
-                        # Create role
-                        new_role = await guild.create_role(
-                            name=team_name,
-                            color=color,
-                            mentionable=True,
-                            reason="Alfred bot setup",
-                        )
-                        print(
-                            f"  ✅ Created Discord role '{team_name}' (ID: {new_role.id})"
-                        )
+            results = await roles_task
 
-                        # Update team in database with Discord role ID
-                        team = self.team_service.data_service.get_team_by_name(
-                            team_name
-                        )
-                        if team:
-                            update = TeamUpdate(discord_role_id=new_role.id)
-                            self.team_service.data_service.update_team(team.id, update)
-                            print(f"     → Updated database with Discord role ID")
-                except Exception as e:
-                    print(f"  ❌ Error creating role '{team_name}': {e}")
+            role_updates = []
+            for team_name, result in zip(new_team_names, results):
+                if isinstance(result, Exception):
+                    print(f"  ❌ Error creating role '{team_name}': {result}")
+                    continue
+
+                print(f"  ✅ Created Discord role '{team_name}' (ID: {result.id})")
+                team = teams_by_name.get(team_name)
+                if team:
+                    role_updates.append((team, TeamUpdate(discord_role_id=result.id)))
+
+            # Save the new role IDs in one request
+            try:
+                for team in await asyncio.to_thread(
+                    self.team_service.data_service.update_teams, role_updates
+                ):
+                    teams_by_name[team.name] = team
+                    print(f"     → Updated '{team.name}' with Discord role ID")
+            except Exception as e:
+                print(f"  ❌ Error saving Discord role IDs: {e}")
 
         # Step 4: Initialize Google Drive folders
         print("\n" + "=" * 60)
@@ -219,6 +251,8 @@ class SetupBot(commands.Bot):
         if not self.docs_service.is_available():
             print("⚠️  Google Docs service not available - skipping Drive setup")
             print("   Configure GOOGLE_CREDENTIALS_PATH to enable this feature")
+        elif not pending:
+            print("  ✅ All primary teams already have folder structures")
         else:
             # Create Team Management folder
             print("\n📁 Creating Team Management folder...")
@@ -231,41 +265,46 @@ class SetupBot(commands.Bot):
 
             # Create team folders
             print("\n📁 Creating team folder structures...")
-            primary_teams = ["Engineering", "Product", "Business"]
-
-            for team_name in primary_teams:
-                team = self.team_service.data_service.get_team_by_name(team_name)
-                if not team:
-                    print(f"  ⚠️  Team '{team_name}' not found in database")
-                    continue
 
-                # Skip if already has folder structure
-                if team.roster_sheet_id:
-                    print(f"  ⏭️  Team '{team_name}' already has folder structure")
-                    continue
+            # Create the folder structures concurrently, off the event loop
+            results = await asyncio.to_thread(
+                self.docs_service.create_team_folder_structures,
+                [team.name for team in pending],
+            )
 
-                print(f"\n  🔧 Setting up '{team_name}'...")
-                try:
-                    result = self.docs_service.create_team_folder_structure(team_name)
-                    if result:
-                        print(f"     ✅ Folder: {result['folder_id']}")
-                        print(f"     ✅ Overview: {result['overview_doc_url']}")
-                        print(f"     ✅ Roster: {result['roster_sheet_url']}")
-
-                        # Update team record
-                        update = TeamUpdate(
-                            drive_folder_id=result["folder_id"],
-                            overview_doc_id=result["overview_doc_id"],
-                            overview_doc_url=result["overview_doc_url"],
-                            roster_sheet_id=result["roster_sheet_id"],
-                            roster_sheet_url=result["roster_sheet_url"],
+            folder_updates = []
+            for team in pending:
+                print(f"\n  🔧 Setting up '{team.name}'...")
+                result = results.get(team.name)
+                if result:
+                    print(f"     ✅ Folder: {result['folder_id']}")
+                    print(f"     ✅ Overview: {result['overview_doc_url']}")
+                    print(f"     ✅ Roster: {result['roster_sheet_url']}")
+
+                    folder_updates.append(
+                        (
+                            team,
+                            TeamUpdate(
+                                drive_folder_id=result["folder_id"],
+                                overview_doc_id=result["overview_doc_id"],
+                                overview_doc_url=result["overview_doc_url"],
+                                roster_sheet_id=result["roster_sheet_id"],
+                                roster_sheet_url=result["roster_sheet_url"],
+                            ),
                         )
-                        self.team_service.data_service.update_team(team.id, update)
-                        print(f"     ✅ Updated database")
-                    else:
-                        print(f"     ❌ Failed to create folder structure")
-                except Exception as e:
-                    print(f"     ❌ Error: {e}")
+                    )
+                else:
+                    print(f"     ❌ Failed to create folder structure")
+
+            # Save all team folder IDs in one request
+            try:
+                updated = await asyncio.to_thread(
+                    self.team_service.data_service.update_teams, folder_updates
+                )
+                if updated:
+                    print(f"\n✅ Updated {len(updated)} team records in database")
+            except Exception as e:
+                print(f"\n❌ Error updating team records: {e}")
 
         # Step 5: Summary
         print("\n" + "=" * 60)
@@ -287,6 +326,12 @@ class SetupBot(commands.Bot):
 
 async def main():
     """Main setup function."""
+    parser = argparse.ArgumentParser(description="Alfred Bot complete setup")
+    parser.add_argument("--admin-discord-id", help="Admin's Discord user ID")
+    parser.add_argument("--admin-name", help="Admin's full name")
+    parser.add_argument("--admin-email", help="Admin's email")
+    args = parser.parse_args()
+
     print("🚀 Alfred Bot - Complete Setup")
     print("=" * 60)
     print()
@@ -306,8 +351,31 @@ async def main():
             print(f"   - {var}")
         return 1
 
+    # Ask for any admin details not passed on the command line before the
+    # bot starts, so the prompts don't block its event loop
+    admin_prompts = {
+        "admin_discord_id": "Enter your Discord ID (right-click profile → Copy ID): ",
+        "admin_name": "Enter your full name: ",
+        "admin_email": "Enter your email: ",
+    }
+    admin = {}
+    for field, prompt in admin_prompts.items():
+        value = getattr(args, field)
+        if not value and sys.stdin.isatty():
+            value = input(prompt)
+        admin[field] = (value or "").strip()
+
+    if not all(admin.values()):
+        print("❌ Admin Discord ID, name and email are all required")
+        print("   Pass --admin-discord-id, --admin-name and --admin-email")
+        return 1
+
+    if not admin["admin_discord_id"].isdigit():
+        print("❌ Admin Discord ID must be a number")
+        return 1
+
     # Create and run bot
-    bot = SetupBot()
+    bot = SetupBot(**admin)
 
     try:
         await bot.start(os.getenv("DISCORD_BOT_TOKEN"))
@@ -1,24 +1,22 @@
+import json
 import os
 from dotenv import load_dotenv
 from langchain.prompts import PromptTemplate
 from langchain_core.runnables import RunnableSequence
-from langchain_anthropic import ChatAnthropic
 from datetime import datetime, timedelta
-from github_client import GitHubClient
+from github_client import get_github_client
+from llm import get_llm
 
 load_dotenv()
 
 class CommitAnalyzer:
     """Manages commit analysis workflow using LangChain"""
     def __init__(self, github_token: str, llm_model: str = "gpt-4"):
-        self.github_client = GitHubClient(github_token)
+        self.github_client = get_github_client(github_token)
         anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
         if not anthropic_api_key:
             raise ValueError("ANTHROPIC_API_KEY environment variable is required")
-        self.llm = ChatAnthropic(
-            model="claude-3-sonnet-20240229",
-            anthropic_api_key=anthropic_api_key
-            )
+        self.llm = get_llm(anthropic_api_key)
         self.analysis_chain = self._create_analysis_chain()
 
     def fetch_commit_data(self, owner_and_repo: str) -> str:
@@ -27,7 +25,22 @@ class CommitAnalyzer:
         since = (datetime.utcnow() - timedelta(days=1)).isoformat() + "Z"  # Last 24 hours
 
         commits = self.github_client.get_commit_details(owner, repo, since)
-        return str(commits)
+
+        # Patches are the bulk of the payload and the prompt only asks about
+        # which files changed, so send file names and line counts
+        return json.dumps([
+            {
+                "sha": commit["sha"][:7],
+                "message": commit["message"],
+                "author": commit["author"],
+                "date": commit["date"],
+                "files": [
+                    {"filename": file["filename"], "additions": file["additions"], "deletions": file["deletions"]}
+                    for file in commit["files"]
+                ],
+            }
+            for commit in commits
+        ], separators=(",", ":"))
 
     def _create_analysis_chain(self):
         """Create LangChain pipeline for summarizing commits"""
@@ -1,9 +1,9 @@
 import os
+import re
+from functools import lru_cache
 from dotenv import load_dotenv
 from langchain.prompts import ChatPromptTemplate 
-from langgraph.graph import StateGraph
-from langgraph.prebuilt import ToolNode
-from langchain.tools import Tool
+from langgraph.graph import END, START, StateGraph
 from github_tools import GitHubTools
 from typing import TypedDict, Annotated
 
@@ -19,49 +19,50 @@ if not GITHUB_TOKEN:
     raise ValueError("GITHUB_TOKEN environment variable is required")
 github_tools = GitHubTools(GITHUB_TOKEN)
 
-# Tools
-issue_tool = Tool(
-   name="analyze_issues",
-   func=github_tools.analyze_issues,
-   description="Analyzes GitHub issues"
-)
+# Keywords that route a query to each analysis node, checked in this order
+ROUTES = {
+   "analyze_issues": ("issue", "closed"),
+   "analyze_commits": ("commit", "bug fix", "feature"),
+}
+ROUTE_PATTERNS = [
+   (node, re.compile("|".join(map(re.escape, keywords))))
+   for node, keywords in ROUTES.items()
+]
 
-commit_tool = Tool(
-   name="analyze_commits", 
-   func=github_tools.analyze_commits,
-   description="Analyzes GitHub commits"
-)
+def route(state):
+   query = state["query"].lower()
+   for node, pattern in ROUTE_PATTERNS:
+       if pattern.search(query):
+           return node
+   return END
 
-tools = [issue_tool, commit_tool]
-tool_node = ToolNode(tools=tools)
+def analyze_issues(state):
+   return {"result": github_tools.analyze_issues(state["repo"])}
 
-def process_query(state):
-   query = state["query"].lower()
-   if "issue" in query or "closed" in query:
-       return {"analyze_issues": state}
-   elif "commit" in query or "bug fix" in query or "feature" in query:
-       return {"analyze_commits": state}
-   return {"end": state}
+def analyze_commits(state):
+   return {"result": github_tools.analyze_commits(state["repo"])}
 
 workflow = StateGraph(AgentState)
 
 # Add nodes
-workflow.add_node("process_query", process_query)
-workflow.add_node("analyze_issues", tool_node)
-workflow.add_node("analyze_commits", tool_node)
-
-# Add edges
-workflow.set_entry_point("process_query")
-workflow.set_finish_point("end")
+workflow.add_node("analyze_issues", analyze_issues)
+workflow.add_node("analyze_commits", analyze_commits)
 
-workflow.add_edge("analyze_issues", "end")
-workflow.add_edge("analyze_commits", "end")
+# Route straight from the query to one analysis node
+workflow.add_conditional_edges(START, route, ["analyze_issues", "analyze_commits", END])
+workflow.add_edge("analyze_issues", END)
+workflow.add_edge("analyze_commits", END)
 
 graph = workflow.compile()
 
-def query_github(query: str, repo: str):
+@lru_cache(maxsize=256)
+def _query_github(query: str, repo: str):
    return graph.invoke({"query": query, "repo": repo, "result": None})
 
+def query_github(query: str, repo: str):
+   # Repeated questions in a run reuse the earlier answer
+   return _query_github(query.lower(), repo)
+
 if __name__ == "__main__":
    repo = "ashwin2912/fetch-tailored-reviews"
    
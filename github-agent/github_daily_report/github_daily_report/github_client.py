@@ -1,9 +1,35 @@
+import json
+import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timedelta
+from typing import Optional
 from langchain.prompts import PromptTemplate
 from langchain_core.runnables import RunnableSequence
 from langchain_openai import ChatOpenAI
 
+# orjson encodes and parses GitHub payloads faster; fall back to stdlib json
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# A commit's changed files never change, so they're kept on disk between runs
+COMMIT_FILES_CACHE = os.path.join(
+    os.getenv("GITHUB_CACHE_DIR", os.path.expanduser("~/.cache/github_daily_report")),
+    "commit_files.json"
+)
+# Most recent commits kept in the cache; older entries are dropped on save
+COMMIT_FILES_CACHE_SIZE = 2000
+# Per-file fields kept; patches are large and the commit prompt doesn't use them
+COMMIT_FILE_FIELDS = ("filename", "changes", "additions", "deletions")
+
 class GitHubClient:
     """Handles GitHub API requests using GraphQL and REST"""
     def __init__(self, token: str):
@@ -14,17 +40,69 @@ class GitHubClient:
         }
         self.graphql_url = "https://api.github.com/graphql"
 
+        # Reuse keep-alive connections and retry transient GitHub errors;
+        # the GraphQL POSTs are read-only queries, so they're safe to retry
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504), allowed_methods=frozenset({"GET", "POST"}))
+        self.session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries))
+
+        self.commit_files_cache = self._load_commit_files_cache()
+        self.default_branches = {}
+
+    def _load_commit_files_cache(self) -> dict:
+        """Loads cached commit files, keyed by owner/repo@sha"""
+        try:
+            with open(COMMIT_FILES_CACHE) as f:
+                cache = json.load(f)
+            # Drop fields (e.g. patches) written by older versions
+            return {
+                key: [{field: file[field] for field in COMMIT_FILE_FIELDS} for file in files]
+                for key, files in cache.items()
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return {}
+
+    def _save_commit_files_cache(self):
+        """Writes cached commit files back to disk, keeping the newest entries"""
+        for key in list(self.commit_files_cache)[:-COMMIT_FILES_CACHE_SIZE]:
+            del self.commit_files_cache[key]
+        try:
+            os.makedirs(os.path.dirname(COMMIT_FILES_CACHE), exist_ok=True)
+            with open(COMMIT_FILES_CACHE, "w") as f:
+                json.dump(self.commit_files_cache, f)
+        except OSError:
+            pass
+
     def execute_query(self, query: str, variables: dict) -> dict:
         """Executes a GraphQL query"""
-        response = requests.post(self.graphql_url, json={"query": query, "variables": variables}, headers=self.headers)
-        return response.json()
+        # The session already sends Content-Type: application/json
+        response = self.session.post(self.graphql_url, data=json_dumps({"query": query, "variables": variables}))
+        return json_loads(response.content)
 
-    def get_commit_details(self, owner: str, repo: str, since: str) -> list:
-        """Fetches recent commits using GraphQL"""
+    def get_default_branch(self, owner: str, repo: str) -> str:
+        """Returns the repository's default branch, looked up once per repo"""
+        key = f"{owner}/{repo}"
+        if key not in self.default_branches:
+            query = """
+            query DefaultBranch($owner: String!, $repo: String!) {
+                repository(owner: $owner, name: $repo) {
+                    defaultBranchRef { name }
+                }
+            }
+            """
+            data = self.execute_query(query, {"owner": owner, "repo": repo})
+            repository = (data.get("data") or {}).get("repository") or {}
+            self.default_branches[key] = (repository.get("defaultBranchRef") or {}).get("name", "main")
+        return self.default_branches[key]
+
+    def get_commit_details(self, owner: str, repo: str, since: str, branch: Optional[str] = None) -> list:
+        """Fetches recent commits on a branch (the default branch if not given) using GraphQL"""
+        branch = branch or self.get_default_branch(owner, repo)
         query = """
-        query RecentCommits($owner: String!, $repo: String!, $since: GitTimestamp!) {
+        query RecentCommits($owner: String!, $repo: String!, $since: GitTimestamp!, $branch: String!) {
             repository(owner: $owner, name: $repo) {
-                ref(qualifiedName: "refs/heads/github-client") {
+                ref(qualifiedName: $branch) {
                     target {
                         ... on Commit {
                             history(since: $since, first: 10) {
@@ -44,12 +122,24 @@ class GitHubClient:
             }
         }
         """
-        variables = {"owner": owner, "repo": repo, "since": since}
+        variables = {"owner": owner, "repo": repo, "since": since, "branch": f"refs/heads/{branch}"}
         data = self.execute_query(query, variables)
-        commits = data.get("data", {}).get("repository", {}).get("ref", {}).get("target", {}).get("history", {}).get("edges", [])
+        # Missing repos or branches come back as nulls
+        repository = (data.get("data") or {}).get("repository") or {}
+        target = (repository.get("ref") or {}).get("target") or {}
+        commits = (target.get("history") or {}).get("edges", [])
         
+        # GraphQL has no per-commit file list, so fetch the files for every
+        # commit over REST in parallel instead of one request at a time
+        shas = [commit["node"]["oid"] for commit in commits]
+        cached_count = len(self.commit_files_cache)
+        with ThreadPoolExecutor(max_workers=max(len(shas), 1)) as executor:
+            commit_files = list(executor.map(lambda sha: self.get_commit_files(owner, repo, sha), shas))
+        if len(self.commit_files_cache) != cached_count:
+            self._save_commit_files_cache()
+
         commit_list = []
-        for commit in commits:
+        for commit, files in zip(commits, commit_files):
             commit_data = commit["node"]
             commit_details = {
                 "sha": commit_data["oid"],
@@ -58,7 +148,7 @@ class GitHubClient:
                 "email": commit_data["author"]["email"],
                 "date": commit_data["committedDate"],
                 "url": commit_data["url"],
-                "files": self.get_commit_files(owner, repo, commit_data["oid"])  # Fetch file changes
+                "files": files
             }
             commit_list.append(commit_details)
 
@@ -97,19 +187,25 @@ class GitHubClient:
 
     def get_commit_files(self, owner: str, repo: str, commit_sha: str) -> list:
         """Fetches changed files for a commit using GitHub REST API"""
+        cache_key = f"{owner}/{repo}@{commit_sha}"
+        if cache_key in self.commit_files_cache:
+            return self.commit_files_cache[cache_key]
+
         commit_url = f"https://api.github.com/repos/{owner}/{repo}/commits/{commit_sha}"
-        response = requests.get(commit_url, headers=self.headers)
-        commit_data = response.json()
-
-        files = []
-        for file in commit_data.get("files", []):
-            files.append({
-                "filename": file["filename"],
-                "changes": file["changes"],
-                "additions": file["additions"],
-                "deletions": file["deletions"],
-                "patch": file.get("patch", "No patch available")
-            })
+        response = self.session.get(commit_url)
+        commit_data = json_loads(response.content)
+
+        files = [
+            {field: file[field] for field in COMMIT_FILE_FIELDS}
+            for file in commit_data.get("files", [])
+        ]
+
+        if response.ok:
+            self.commit_files_cache[cache_key] = files
         return files
 
 
+@lru_cache(maxsize=None)
+def get_github_client(token: str) -> GitHubClient:
+    """Returns one GitHubClient per token so analyzers share its session"""
+    return GitHubClient(token)
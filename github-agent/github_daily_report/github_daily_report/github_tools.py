@@ -1,3 +1,4 @@
+from typing import Iterator
 from issue_analyzer import IssueAnalyzer
 from commit_analyzer import CommitAnalyzer
 
@@ -11,6 +12,10 @@ class GitHubTools:
         """Fetch and analyze issues from a repository"""
         return self.issue_analyzer.analyze_repository(repo)
 
+    def stream_issues(self, repo: str) -> Iterator[str]:
+        """Analyze issues from a repository, yielding the summary as it is generated"""
+        return self.issue_analyzer.stream_analysis(repo)
+
     def analyze_commits(self, repo: str) -> str:
         """Fetch and analyze commits from a repository"""
         return self.commit_analyzer.analyze_repository(repo)
\ No newline at end of file
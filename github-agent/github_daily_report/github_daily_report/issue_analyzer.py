@@ -1,27 +1,50 @@
+import json
 import os
 from dotenv import load_dotenv
 from langchain.prompts import PromptTemplate
 from langchain_core.runnables import RunnableSequence
-from langchain_anthropic import ChatAnthropic
-from github_client import GitHubClient
+from typing import Iterator
+from github_client import get_github_client
+from llm import get_llm
 
 load_dotenv()
 
 class IssueAnalyzer:
     """Manages the GitHub issue analysis workflow"""
     def __init__(self, github_token: str, llm_model: str = "gpt-4"):
-        self.github_client = GitHubClient(github_token)
-        self.llm = ChatAnthropic(
-            model="claude-3-sonnet-20240229",
-            anthropic_api_key=os.getenv("ANTHROPIC_API_KEY")
-            )
+        self.github_client = get_github_client(github_token)
+        self.llm = get_llm(os.getenv("ANTHROPIC_API_KEY"))
         self.analysis_chain = self._create_analysis_chain()
 
     def fetch_issue_data(self, owner_and_repo: str) -> str:
         """Fetch issues and comments from GitHub repository"""
         owner, repo = owner_and_repo.split("/")
         issue_data = self.github_client.get_issues(owner, repo)
-        return str(issue_data)
+        return self._summarize_issues(issue_data)
+
+    @staticmethod
+    def _summarize_issues(issue_data: dict) -> str:
+        """Keep only the issue fields the prompt uses, as compact JSON"""
+        repository = (issue_data.get("data") or {}).get("repository") or {}
+        issues = (repository.get("issues") or {}).get("nodes", [])
+
+        def login(node):
+            return (node.get("author") or {}).get("login")
+
+        return json.dumps([
+            {
+                "number": issue["number"],
+                "title": issue["title"],
+                "state": issue["state"],
+                "author": login(issue),
+                "labels": [label["name"] for label in issue["labels"]["nodes"]],
+                "comments": [
+                    {"author": login(comment), "body": comment["body"]}
+                    for comment in issue["comments"]["nodes"]
+                ],
+            }
+            for issue in issues
+        ], separators=(",", ":"))
 
     def _create_analysis_chain(self):
         """Create LangChain processing chain"""
@@ -56,7 +79,11 @@ class IssueAnalyzer:
         Data: {issues_data}
         """
 
+    def stream_analysis(self, owner_and_repo: str) -> Iterator[str]:
+        """Execute the issue analysis workflow, yielding text as the LLM produces it"""
+        for chunk in self.analysis_chain.stream({"owner_and_repo": owner_and_repo}):
+            yield chunk.content
+
     def analyze_repository(self, owner_and_repo: str) -> str:
         """Execute the full issue analysis workflow"""
-        result = self.analysis_chain.invoke({"owner_and_repo": owner_and_repo})
-        return result.content
\ No newline at end of file
+        return "".join(self.stream_analysis(owner_and_repo))
\ No newline at end of file
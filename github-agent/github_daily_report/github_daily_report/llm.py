@@ -0,0 +1,12 @@
+from functools import lru_cache
+from langchain_anthropic import ChatAnthropic
+
+ANALYSIS_MODEL = "claude-3-sonnet-20240229"
+
+@lru_cache(maxsize=1)
+def get_llm(anthropic_api_key: str, model: str = ANALYSIS_MODEL) -> ChatAnthropic:
+    """Returns a shared chat model so every analyzer reuses one client"""
+    return ChatAnthropic(
+        model=model,
+        anthropic_api_key=anthropic_api_key
+        )
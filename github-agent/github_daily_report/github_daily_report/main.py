@@ -6,19 +6,20 @@ load_dotenv()
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from commit_analyzer import CommitAnalyzer
-from issue_analyzer import IssueAnalyzer
+from github_tools import GitHubTools
 
 
 if __name__ == "__main__":
     github_token = os.getenv("GITHUB_TOKEN")
     if not github_token:
         raise ValueError("GITHUB_TOKEN environment variable is required")
-    commit_analyzer = CommitAnalyzer(github_token=github_token)
-    issue_analyzer = IssueAnalyzer(github_token=github_token)
+    # One analyzer pair, sharing a GitHub session and LLM client
+    github_tools = GitHubTools(github_token)
     # Perform analysis
-    result = commit_analyzer.analyze_repository("ashwin2912/fetch-tailored-reviews")
+    result = github_tools.analyze_commits("ashwin2912/fetch-tailored-reviews")
     print(result)
 
-    result = issue_analyzer.analyze_repository("ashwin2912/fetch-tailored-reviews")
-    print(result)
\ No newline at end of file
+    # Print the issue summary as it streams in
+    for chunk in github_tools.stream_issues("ashwin2912/fetch-tailored-reviews"):
+        print(chunk, end="", flush=True)
+    print()
\ No newline at end of file
@@ -477,6 +477,58 @@ class DataService:
         except Exception as e:
             raise Exception(f"Failed to list teams: {str(e)}")
 
+    def list_team_names_and_ids(self) -> List[Tuple[UUID, str]]:
+        """List (id, name) for all teams without loading full team rows."""
+        try:
+            response = self.client.table("teams").select("id, name").execute()
+            return [(UUID(team["id"]), team["name"]) for team in response.data]
+        except Exception as e:
+            raise Exception(f"Failed to list teams: {str(e)}")
+
+    def list_teams_missing_structure(self) -> List[Team]:
+        """List teams that don't have a Drive folder structure yet."""
+        try:
+            response = (
+                self.client.table("teams")
+                .select("*")
+                .is_("roster_sheet_id", "null")
+                .execute()
+            )
+            return [Team(**team) for team in response.data]
+        except Exception as e:
+            raise Exception(f"Failed to list teams: {str(e)}")
+
+    def update_teams(self, updates: List[Tuple[Team, TeamUpdate]]) -> List[Team]:
+        """
+        Update several teams in a single request.
+
+        Each team is sent as its full row merged with the non-None update
+        fields, so the upsert satisfies the table's NOT NULL columns.
+
+        Args:
+            updates: (team, updates) pairs
+
+        Returns:
+            Updated teams
+        """
+        try:
+            rows = []
+            for team, team_updates in updates:
+                row = team.model_dump(mode="json", exclude={"created_at", "updated_at"})
+                row.update(team_updates.model_dump(mode="json", exclude_none=True))
+                rows.append(row)
+
+            if not rows:
+                return []
+
+            response = (
+                self.client.table("teams").upsert(rows, on_conflict="id").execute()
+            )
+            return [Team(**team) for team in response.data]
+
+        except Exception as e:
+            raise Exception(f"Failed to update teams: {str(e)}")
+
     def get_team_by_name(self, name: str) -> Optional[Team]:
         """Get team by name."""
         try:
@@ -971,6 +1023,55 @@ class DataService:
         except Exception as e:
             raise Exception(f"Failed to add member to team: {str(e)}")
 
+    def upsert_member_to_team(
+        self, member_id: UUID, team_id: UUID, role: Optional[str] = None
+    ) -> Tuple[Optional[TeamMembership], bool]:
+        """
+        Add a member to a team unless they already have a membership.
+
+        Uses the UNIQUE(team_id, member_id) constraint (ON CONFLICT DO
+        NOTHING) so no existence query is needed before writing. An existing
+        membership, including its role, is left unchanged.
+
+        Args:
+            member_id: Team member UUID
+            team_id: Team UUID
+            role: Role within the team (optional, e.g., "Senior Engineer")
+
+        Returns:
+            Tuple of (membership, created). created is False and membership is
+            None if the member was already on the team.
+
+        Raises:
+            Exception if the insert fails
+        """
+        try:
+            membership_data = {
+                "member_id": str(member_id),
+                "team_id": str(team_id),
+                "role": role,
+                "is_active": True,
+            }
+
+            response = (
+                self.client.table("team_memberships")
+                .upsert(
+                    membership_data,
+                    on_conflict="team_id,member_id",
+                    ignore_duplicates=True,
+                )
+                .execute()
+            )
+
+            # Only an actual insert returns a row
+            if not response.data:
+                return None, False
+
+            return TeamMembership(**response.data[0]), True
+
+        except Exception as e:
+            raise Exception(f"Failed to upsert team membership: {str(e)}")
+
     def remove_member_from_team(self, member_id: UUID, team_id: UUID) -> bool:
         """
         Remove a member from a team (soft delete).
@@ -67,6 +67,8 @@ CREATE TABLE IF NOT EXISTS teams (
 CREATE INDEX IF NOT EXISTS idx_teams_name ON teams(name);
 CREATE INDEX IF NOT EXISTS idx_teams_lead ON teams(team_lead_id);
 CREATE INDEX IF NOT EXISTS idx_teams_parent ON teams(parent_team_id);
+CREATE INDEX IF NOT EXISTS idx_teams_general_channel ON teams(discord_general_channel_id);
+CREATE INDEX IF NOT EXISTS idx_teams_standup_channel ON teams(discord_standup_channel_id);
 
 -- Roles Table
 CREATE TABLE IF NOT EXISTS roles (
@@ -258,6 +260,66 @@ RETURNS INTEGER AS $$
     WHERE manager_id = manager_id_param AND status = 'active';
 $$ LANGUAGE SQL STABLE;
 
+-- Function to create (or replace) an admin account in one call
+CREATE OR REPLACE FUNCTION create_admin_member(
+    member_data JSONB,
+    replace_member_id UUID DEFAULT NULL
+)
+RETURNS SETOF team_members AS $$
+BEGIN
+    IF replace_member_id IS NOT NULL THEN
+        DELETE FROM team_memberships WHERE member_id = replace_member_id;
+        DELETE FROM team_members WHERE id = replace_member_id;
+    END IF;
+
+    RETURN QUERY
+    INSERT INTO team_members (
+        user_id,
+        discord_id,
+        discord_username,
+        name,
+        email,
+        phone,
+        bio,
+        role,
+        status,
+        profile_doc_id,
+        profile_url
+    )
+    VALUES (
+        (member_data->>'user_id')::UUID,
+        (member_data->>'discord_id')::BIGINT,
+        member_data->>'discord_username',
+        member_data->>'name',
+        member_data->>'email',
+        member_data->>'phone',
+        member_data->>'bio',
+        member_data->>'role',
+        COALESCE(member_data->>'status', 'active'),
+        member_data->>'profile_doc_id',
+        member_data->>'profile_url'
+    )
+    RETURNING *;
+END;
+$$ LANGUAGE plpgsql SECURITY INVOKER SET search_path = public;
+
+-- Deletes and inserts members, so only the service role may call this through /rpc
+REVOKE EXECUTE ON FUNCTION create_admin_member(JSONB, UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION create_admin_member(JSONB, UUID) TO service_role;
+
+-- Function to clear pending_onboarding and team_members for a fresh start
+CREATE OR REPLACE FUNCTION reset_onboarding_tables()
+RETURNS void AS $$
+BEGIN
+    TRUNCATE pending_onboarding;
+    DELETE FROM team_members;
+END;
+$$ LANGUAGE plpgsql SECURITY INVOKER SET search_path = public;
+
+-- TRUNCATE ignores RLS, so only the service role may call this through /rpc
+REVOKE EXECUTE ON FUNCTION reset_onboarding_tables() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION reset_onboarding_tables() TO service_role;
+
 -- ============================================================================
 -- VIEWS
 -- ============================================================================
@@ -357,6 +419,20 @@ CREATE TRIGGER trigger_update_team_updated_at
     FOR EACH ROW
     EXECUTE FUNCTION update_team_updated_at();
 
+-- Trigger to update team_memberships updated_at
+CREATE OR REPLACE FUNCTION update_team_membership_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trigger_update_team_membership_updated_at
+    BEFORE UPDATE ON team_memberships
+    FOR EACH ROW
+    EXECUTE FUNCTION update_team_membership_updated_at();
+
 -- ============================================================================
 -- ROW LEVEL SECURITY (RLS)
 -- ============================================================================
@@ -0,0 +1,10 @@
+-- ============================================================================
+-- Migration 016: Index Team Discord Channel Columns
+-- ============================================================================
+-- /team-report resolves the team for the channel it was run in by filtering
+-- teams on discord_general_channel_id OR discord_standup_channel_id.
+-- Index both columns so the lookup doesn't scan the teams table.
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_teams_general_channel ON teams(discord_general_channel_id);
+CREATE INDEX IF NOT EXISTS idx_teams_standup_channel ON teams(discord_standup_channel_id);
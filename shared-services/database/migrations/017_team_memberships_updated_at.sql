@@ -0,0 +1,20 @@
+-- ============================================================================
+-- Migration 017: Maintain team_memberships.updated_at
+-- ============================================================================
+-- Keep team_memberships.updated_at current on update like the other tables
+-- do.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION update_team_membership_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_update_team_membership_updated_at ON team_memberships;
+CREATE TRIGGER trigger_update_team_membership_updated_at
+    BEFORE UPDATE ON team_memberships
+    FOR EACH ROW
+    EXECUTE FUNCTION update_team_membership_updated_at();
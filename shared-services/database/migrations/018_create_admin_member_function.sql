@@ -0,0 +1,54 @@
+-- ============================================================================
+-- Migration 018: create_admin_member Function
+-- ============================================================================
+-- scripts/create_admin.py used to delete an existing account's memberships,
+-- delete the member and insert the new row as separate requests. Do it in one
+-- function call so an overwrite is a single round trip and can't leave the
+-- admin deleted but not recreated.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION create_admin_member(
+    member_data JSONB,
+    replace_member_id UUID DEFAULT NULL
+)
+RETURNS SETOF team_members AS $$
+BEGIN
+    IF replace_member_id IS NOT NULL THEN
+        DELETE FROM team_memberships WHERE member_id = replace_member_id;
+        DELETE FROM team_members WHERE id = replace_member_id;
+    END IF;
+
+    RETURN QUERY
+    INSERT INTO team_members (
+        user_id,
+        discord_id,
+        discord_username,
+        name,
+        email,
+        phone,
+        bio,
+        role,
+        status,
+        profile_doc_id,
+        profile_url
+    )
+    VALUES (
+        (member_data->>'user_id')::UUID,
+        (member_data->>'discord_id')::BIGINT,
+        member_data->>'discord_username',
+        member_data->>'name',
+        member_data->>'email',
+        member_data->>'phone',
+        member_data->>'bio',
+        member_data->>'role',
+        COALESCE(member_data->>'status', 'active'),
+        member_data->>'profile_doc_id',
+        member_data->>'profile_url'
+    )
+    RETURNING *;
+END;
+$$ LANGUAGE plpgsql SECURITY INVOKER SET search_path = public;
+
+-- Deletes and inserts members, so only the service role may call this through /rpc
+REVOKE EXECUTE ON FUNCTION create_admin_member(JSONB, UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION create_admin_member(JSONB, UUID) TO service_role;
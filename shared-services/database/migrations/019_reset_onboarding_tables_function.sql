@@ -0,0 +1,25 @@
+-- ============================================================================
+-- Migration 019: reset_onboarding_tables Function
+-- ============================================================================
+-- scripts/reset_database.py clears pending_onboarding and team_members for
+-- testing. PostgREST refuses a DELETE without a filter, so wiping a table
+-- meant selecting every ID and deleting in batches. This function does the
+-- full reset in one call.
+--
+-- Nothing references pending_onboarding, so it is truncated. team_members is
+-- referenced by teams.team_lead_id and other tables, and TRUNCATE ... CASCADE
+-- would empty those too, so its rows are deleted and the foreign keys'
+-- ON DELETE rules apply as usual.
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION reset_onboarding_tables()
+RETURNS void AS $$
+BEGIN
+    TRUNCATE pending_onboarding;
+    DELETE FROM team_members;
+END;
+$$ LANGUAGE plpgsql SECURITY INVOKER SET search_path = public;
+
+-- TRUNCATE ignores RLS, so only the service role may call this through /rpc
+REVOKE EXECUTE ON FUNCTION reset_onboarding_tables() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION reset_onboarding_tables() TO service_role;
@@ -624,7 +624,7 @@ class GoogleDocsService:
             # Create team folder
             team_folder_id = self.get_or_create_folder(team_name)
 
-            # Create Team Overview document
+            # Team Overview document content
             overview_content = f"""# {team_name} Team
 
 ## Team Introduction
@@ -639,13 +639,30 @@ Welcome to the {team_name} team!
 ## Resources
 - Active Team Members: [Link will be in the same folder]
 """
-            overview_doc = self.create_document(
-                title=f"{team_name} - Team Overview",
-                content=overview_content,
-                folder_id=team_folder_id,
+
+            # Create the overview doc and roster sheet directly in the team
+            # folder with one Drive batch request instead of create + move
+            # round-trips per file
+            created = self._batch_create_files(
+                {
+                    "overview": {
+                        "name": f"{team_name} - Team Overview",
+                        "mimeType": "application/vnd.google-apps.document",
+                        "parents": [team_folder_id],
+                    },
+                    "roster": {
+                        "name": f"{team_name} - Active Team Members",
+                        "mimeType": "application/vnd.google-apps.spreadsheet",
+                        "parents": [team_folder_id],
+                    },
+                }
             )
+            overview_doc = created["overview"]
+            roster_sheet = created["roster"]
+
+            self._write_content(overview_doc["id"], overview_content)
 
-            # Create Active Team Members spreadsheet
+            # Active Team Members headers
             roster_headers = [
                 "Name",
                 "Discord Username",
@@ -654,19 +671,14 @@ Welcome to the {team_name} team!
                 "Join Date",
                 "Profile Link",
             ]
-
-            roster_sheet = self.create_spreadsheet(
-                title=f"{team_name} - Active Team Members",
-                folder_id=team_folder_id,
-                headers=roster_headers,
-            )
+            self._write_sheet_headers(roster_sheet["id"], roster_headers)
 
             return {
                 "folder_id": team_folder_id,
-                "overview_doc_id": overview_doc.id,
-                "overview_doc_url": overview_doc.url,
-                "roster_sheet_id": roster_sheet["spreadsheet_id"],
-                "roster_sheet_url": roster_sheet["url"],
+                "overview_doc_id": overview_doc["id"],
+                "overview_doc_url": overview_doc["webViewLink"],
+                "roster_sheet_id": roster_sheet["id"],
+                "roster_sheet_url": roster_sheet["webViewLink"],
             }
 
         except Exception as e:
@@ -843,6 +855,48 @@ Welcome to the {team_name} team!
         except HttpError as e:
             raise Exception(f"Failed to remove access for {email}: {str(e)}")
 
+    def _batch_create_files(
+        self, files: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Create several Drive files in a single batch HTTP request.
+
+        Args:
+            files: Map of request key to Drive file metadata
+
+        Returns:
+            Map of request key to created file (id, name, webViewLink)
+
+        Raises:
+            Exception if any file fails to create
+        """
+        created: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, Exception] = {}
+
+        def _callback(request_id, response, exception):
+            if exception is not None:
+                errors[request_id] = exception
+            else:
+                created[request_id] = response
+
+        batch = self.drive_service.new_batch_http_request(callback=_callback)
+        for key, metadata in files.items():
+            batch.add(
+                self.drive_service.files().create(
+                    body=metadata, fields="id,name,webViewLink"
+                ),
+                request_id=key,
+            )
+        batch.execute()
+
+        if errors:
+            raise Exception(
+                "Failed to create files: "
+                + ", ".join(f"{key}: {err}" for key, err in errors.items())
+            )
+
+        return created
+
     def _write_sheet_headers(self, spreadsheet_id: str, headers: List[str]):
         """Write headers to first row of a sheet."""
         range_name = "Sheet1!A1:Z1"